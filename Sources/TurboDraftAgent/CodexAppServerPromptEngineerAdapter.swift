@@ -135,21 +135,27 @@ public final class CodexAppServerPromptEngineerAdapter: AgentAdapting, @unchecke
         continue
       }
 
-      if let method = msg["method"] as? String, let params = msg["params"] as? [String: Any] {
-        if method == "item/agentMessage/delta",
-           let pTurnId = params["turnId"] as? String,
+      guard let method = msg["method"] as? String, let params = msg["params"] as? [String: Any] else {
+        continue
+      }
+
+      // Dispatch once on the method name; agent deltas make up most of the stream.
+      switch method {
+      case "item/agentMessage/delta":
+        if let pTurnId = params["turnId"] as? String,
            pTurnId == turnId,
            !sawFinalAgent,
            let delta = params["delta"] as? String
         {
-          if agentText.count + delta.utf8.count <= maxOutputBytes {
+          // utf8.count is O(1) on native strings, whereas count walks every
+          // character and made each delta cost O(accumulated text).
+          if agentText.utf8.count + delta.utf8.count <= maxOutputBytes {
             agentText += delta
           }
-          continue
         }
 
-        if method == "item/completed",
-           let pTurnId = params["turnId"] as? String,
+      case "item/completed":
+        if let pTurnId = params["turnId"] as? String,
            pTurnId == turnId,
            let item = params["item"] as? [String: Any],
            let type = item["type"] as? String,
@@ -158,11 +164,10 @@ public final class CodexAppServerPromptEngineerAdapter: AgentAdapting, @unchecke
         {
           agentText = text
           sawFinalAgent = true
-          continue
         }
 
-        if method == "turn/completed",
-           let pThreadId = params["threadId"] as? String,
+      case "turn/completed":
+        if let pThreadId = params["threadId"] as? String,
            pThreadId == threadId,
            let turn = params["turn"] as? [String: Any],
            let id = turn["id"] as? String,
@@ -183,17 +188,19 @@ public final class CodexAppServerPromptEngineerAdapter: AgentAdapting, @unchecke
           throw CodexAppServerPromptEngineerError.protocolError("turn status=\(status) error=\(String(describing: err))")
         }
 
-        if method == "error",
-           let pTurnId = params["turnId"] as? String,
+      case "error":
+        if let pTurnId = params["turnId"] as? String,
            pTurnId == turnId
         {
           let willRetry = (params["willRetry"] as? Bool) ?? false
-          if willRetry {
-            continue
+          if !willRetry {
+            let err = params["error"] as? [String: Any]
+            throw CodexAppServerPromptEngineerError.protocolError("server error: \(String(describing: err))")
           }
-          let err = params["error"] as? [String: Any]
-          throw CodexAppServerPromptEngineerError.protocolError("server error: \(String(describing: err))")
         }
+
+      default:
+        break
       }
     }
 
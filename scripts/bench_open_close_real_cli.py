@@ -20,13 +20,19 @@ try:
 except Exception as ex:  # pragma: no cover
     raise SystemExit(f"Missing pyobjc dependency (AppKit/Quartz): {ex}")
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
 
 # ---------- stats ----------
 
-def percentile_nearest_rank(samples: List[float], p: float) -> Optional[float]:
-    if not samples:
+def nearest_rank_sorted(xs: List[float], p: float) -> Optional[float]:
+    if not xs:
         return None
-    xs = sorted(float(x) for x in samples)
     clamped = max(0.0, min(1.0, float(p)))
     if clamped <= 0.0:
         return xs[0]
@@ -38,11 +44,16 @@ def bootstrap_ci_median(samples: List[float], rounds: int = 1200, seed: int = 17
     if len(samples) < 2:
         return (None, None)
     xs = [float(x) for x in samples]
-    rng = random.Random(seed + len(xs))
+    n = len(xs)
+    rng = random.Random(seed + n)
+    r = max(100, rounds)
+    # Same blocked resampling as the suite: identical draws, one block in memory.
+    block = max(1, 65536 // n)
     meds: List[float] = []
-    for _ in range(max(100, rounds)):
-        rs = [xs[rng.randrange(len(xs))] for _ in range(len(xs))]
-        meds.append(float(statistics.median(rs)))
+    for start in range(0, r, block):
+        k = min(block, r - start) * n
+        flat = rng.choices(xs, k=k)
+        meds.extend(float(statistics.median(flat[i:i + n])) for i in range(0, k, n))
     meds.sort()
     lo = meds[int(math.floor(0.025 * len(meds)))]
     hi = meds[max(0, int(math.ceil(0.975 * len(meds)) - 1))]
@@ -61,14 +72,18 @@ def summarize(samples: List[float]) -> Dict[str, Any]:
             "median_ci95_low_ms": None,
             "median_ci95_high_ms": None,
         }
+    xs = sorted(float(x) for x in samples)
+    n = len(xs)
+    mid = n // 2
+    median = xs[mid] if n % 2 else (xs[mid - 1] + xs[mid]) / 2.0
     lo, hi = bootstrap_ci_median(samples)
     return {
-        "n": len(samples),
-        "min_ms": float(min(samples)),
-        "median_ms": float(statistics.median(samples)),
-        "p95_ms": percentile_nearest_rank(samples, 0.95),
-        "max_ms": float(max(samples)),
-        "mean_ms": float(statistics.mean(samples)),
+        "n": n,
+        "min_ms": xs[0],
+        "median_ms": float(median),
+        "p95_ms": nearest_rank_sorted(xs, 0.95),
+        "max_ms": xs[-1],
+        "mean_ms": math.fsum(xs) / n,
         "median_ci95_low_ms": lo,
         "median_ci95_high_ms": hi,
     }
@@ -79,13 +94,18 @@ def now_iso() -> str:
 
 
 def numeric(v: Any) -> Optional[float]:
+    # Exact-type fast path for plain JSON numbers.
+    t = type(v)
+    if t is float:
+        return v if math.isfinite(v) else None
+    if t is int:
+        x = float(v)
+        return x if math.isfinite(x) else None
     if isinstance(v, bool) or v is None:
         return None
     if isinstance(v, (int, float)):
         x = float(v)
-        if math.isnan(x) or math.isinf(x):
-            return None
-        return x
+        return x if math.isfinite(x) else None
     return None
 
 
@@ -240,36 +260,56 @@ class JSONRPCSocketClient:
         assert self.sock is not None
         payload = json.dumps(obj, separators=(",", ":")).encode("utf-8")
         header = f"Content-Length: {len(payload)}\r\n\r\n".encode("ascii")
-        self.sock.sendall(header + payload)
+        # sendmsg gathers both buffers; the loop resumes after a short write.
+        bufs = [memoryview(header), memoryview(payload)]
+        while bufs:
+            sent = self.sock.sendmsg(bufs)
+            while sent and bufs:
+                if sent >= len(bufs[0]):
+                    sent -= len(bufs.pop(0))
+                else:
+                    bufs[0] = bufs[0][sent:]
+                    sent = 0
 
     def _recv_obj(self) -> Dict[str, Any]:
         assert self.sock is not None
-        buf = b""
-        deadline = time.time() + self.timeout_s
-        while b"\r\n\r\n" not in buf:
-            if time.time() > deadline:
+        buf = bytearray()
+        deadline = time.monotonic() + self.timeout_s
+        # Resume the header search where the last one stopped (less 3 bytes for a
+        # terminator split across reads) instead of rescanning the whole buffer.
+        scan = 0
+        while True:
+            header_end = buf.find(b"\r\n\r\n", scan)
+            if header_end >= 0:
+                break
+            scan = max(0, len(buf) - 3)
+            if time.monotonic() > deadline:
                 raise TimeoutError("timed out reading JSON-RPC headers")
             chunk = self.sock.recv(4096)
             if not chunk:
                 raise ConnectionError("socket closed while reading headers")
             buf += chunk
-        head, rest = buf.split(b"\r\n\r\n", 1)
         length = None
-        for line in head.decode("ascii", errors="replace").split("\r\n"):
+        for line in buf[:header_end].decode("ascii", errors="replace").split("\r\n"):
             if line.lower().startswith("content-length:"):
                 length = int(line.split(":", 1)[1].strip())
                 break
         if length is None:
             raise ValueError("missing content-length header")
-        while len(rest) < length:
-            if time.time() > deadline:
+        frame_end = header_end + 4 + length
+        while len(buf) < frame_end:
+            if time.monotonic() > deadline:
                 raise TimeoutError("timed out reading JSON-RPC payload")
-            chunk = self.sock.recv(4096)
+            chunk = self.sock.recv(max(4096, frame_end - len(buf)))
             if not chunk:
                 raise ConnectionError("socket closed while reading payload")
-            rest += chunk
-        payload = rest[:length]
-        return json.loads(payload.decode("utf-8", errors="replace"))
+            buf += chunk
+        payload = bytes(buf[header_end + 4:frame_end])
+        try:
+            return json_loads(payload)
+        except ValueError:
+            # Not valid UTF-8; decode with replacement instead.
+            return json.loads(payload.decode("utf-8", errors="replace"))
 
     def request(self, req_id: int, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         req = {"jsonrpc": "2.0", "id": req_id, "method": method}
@@ -321,13 +361,13 @@ def wait_for_new_jsonl(path: pathlib.Path, offset: int, timeout_s: float, predic
                     nl = tail.find(b"\n")
                     if nl < 0:
                         break
-                    line = tail[:nl].decode("utf-8", errors="replace").strip()
+                    line = tail[:nl].strip()
                     cur += nl + 1
                     tail = tail[nl + 1:]
                     if not line:
                         continue
                     try:
-                        obj = json.loads(line)
+                        obj = json_loads(line)
                     except Exception:
                         continue
                     if predicate(obj):
@@ -527,7 +567,8 @@ def main() -> int:
     steady = [c for c in successful if not c.get("warmup")]
 
     def samples(key: str) -> List[float]:
-        return [numeric(c.get(key)) for c in steady if numeric(c.get(key)) is not None]  # type: ignore
+        vals = (numeric(c.get(key)) for c in steady)
+        return [v for v in vals if v is not None]
 
     summary = {
         "triggerDispatchMs": summarize(samples("triggerDispatchMs")),
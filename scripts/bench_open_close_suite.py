@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 import argparse
+import collections
+import concurrent.futures
 import datetime as dt
+import hashlib
 import json
 import math
 import os
 import pathlib
 import platform
 import random
-import shlex
+import select
+import shutil
 import socket
 import statistics
 import subprocess
@@ -23,13 +27,38 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     Quartz = None
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Both accept raw bytes, so JSONL lines are parsed without a decode step.
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def jsonl_line(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+def json_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_pretty(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 
 # ---------- stats ----------
 
-def percentile_nearest_rank(samples: List[float], p: float) -> Optional[float]:
-    if not samples:
+def nearest_rank_sorted(xs: List[float], p: float) -> Optional[float]:
+    if not xs:
         return None
-    xs = sorted(float(x) for x in samples)
     clamped = max(0.0, min(1.0, float(p)))
     if clamped <= 0.0:
         return xs[0]
@@ -41,18 +70,25 @@ def bootstrap_ci_median(samples: List[float], rounds: int = 1500, seed: int = 17
     if len(samples) < 2:
         return (None, None)
     xs = [float(x) for x in samples]
-    rng = random.Random(seed + len(xs))
+    n = len(xs)
+    rng = random.Random(seed + n)
+    r = max(100, rounds)
+    # Draw a block of rounds per choices() call and keep only their medians, so
+    # peak memory is one block rather than rounds*n draws. choices() consumes
+    # the RNG stream sequentially, so the blocks reproduce one big draw.
+    block = max(1, 65536 // n)
     meds: List[float] = []
-    for _ in range(max(100, rounds)):
-        rs = [xs[rng.randrange(len(xs))] for _ in range(len(xs))]
-        meds.append(float(statistics.median(rs)))
+    for start in range(0, r, block):
+        k = min(block, r - start) * n
+        flat = rng.choices(xs, k=k)
+        meds.extend(float(statistics.median(flat[i:i + n])) for i in range(0, k, n))
     meds.sort()
     lo = meds[int(math.floor(0.025 * len(meds)))]
     hi = meds[max(0, int(math.ceil(0.975 * len(meds)) - 1))]
     return (lo, hi)
 
 
-def summarize(samples: List[float]) -> Dict[str, Any]:
+def summarize(samples: List[float], sorted_vals: Optional[List[float]] = None) -> Dict[str, Any]:
     if not samples:
         return {
             "n": 0,
@@ -64,25 +100,30 @@ def summarize(samples: List[float]) -> Dict[str, Any]:
             "median_ci95_low_ms": None,
             "median_ci95_high_ms": None,
         }
+    # One sort serves every order statistic below.
+    xs = sorted_vals if sorted_vals is not None else sorted(float(x) for x in samples)
+    n = len(xs)
+    mid = n // 2
+    median = xs[mid] if n % 2 else (xs[mid - 1] + xs[mid]) / 2.0
     lo, hi = bootstrap_ci_median(samples)
     return {
-        "n": len(samples),
-        "min_ms": float(min(samples)),
-        "median_ms": float(statistics.median(samples)),
-        "p95_ms": percentile_nearest_rank(samples, 0.95),
-        "max_ms": float(max(samples)),
-        "mean_ms": float(statistics.mean(samples)),
+        "n": n,
+        "min_ms": xs[0],
+        "median_ms": float(median),
+        "p95_ms": nearest_rank_sorted(xs, 0.95),
+        "max_ms": xs[-1],
+        "mean_ms": math.fsum(xs) / n,
         "median_ci95_low_ms": lo,
         "median_ci95_high_ms": hi,
     }
 
 
-def detect_outliers_iqr(samples: List[Tuple[int, float]]) -> Dict[str, Any]:
+def detect_outliers_iqr(samples: List[Tuple[int, float]], sorted_vals: Optional[List[float]] = None) -> Dict[str, Any]:
     if len(samples) < 4:
         return {"method": "iqr_1.5", "low": None, "high": None, "cycles": []}
-    vals = sorted(v for _, v in samples)
-    q1 = percentile_nearest_rank(vals, 0.25)
-    q3 = percentile_nearest_rank(vals, 0.75)
+    vals = sorted_vals if sorted_vals is not None else sorted(v for _, v in samples)
+    q1 = nearest_rank_sorted(vals, 0.25)
+    q3 = nearest_rank_sorted(vals, 0.75)
     if q1 is None or q3 is None:
         return {"method": "iqr_1.5", "low": None, "high": None, "cycles": []}
     iqr = q3 - q1
@@ -99,13 +140,19 @@ def now_iso() -> str:
 
 
 def numeric(v: Any) -> Optional[float]:
+    # Telemetry values are almost always floats/ints straight from JSON; check
+    # exact types first so the common case skips the isinstance chain.
+    t = type(v)
+    if t is float:
+        return v if math.isfinite(v) else None
+    if t is int:
+        x = float(v)
+        return x if math.isfinite(x) else None
     if isinstance(v, bool) or v is None:
         return None
     if isinstance(v, (int, float)):
         x = float(v)
-        if math.isnan(x) or math.isinf(x):
-            return None
-        return x
+        return x if math.isfinite(x) else None
     if isinstance(v, str):
         s = v.strip()
         if not s:
@@ -114,9 +161,7 @@ def numeric(v: Any) -> Optional[float]:
             x = float(s)
         except Exception:
             return None
-        if math.isnan(x) or math.isinf(x):
-            return None
-        return x
+        return x if math.isfinite(x) else None
     return None
 
 
@@ -125,15 +170,30 @@ def run_capture(cmd: List[str], timeout_s: float = 8.0) -> Tuple[int, str, str]:
     return p.returncode, p.stdout.strip(), p.stderr.strip()
 
 
-def shell_ok(cmd: str, timeout_s: float = 8.0) -> Tuple[bool, str]:
+def argv_ok(argv: List[str], cwd: Optional[pathlib.Path] = None, timeout_s: float = 8.0) -> Tuple[bool, str]:
+    # Execs the target directly: no login shell, no rc-file sourcing.
     try:
-        p = subprocess.run(["/bin/zsh", "-lc", cmd], text=True, capture_output=True, timeout=timeout_s)
+        p = subprocess.run(argv, cwd=cwd, text=True, capture_output=True, timeout=timeout_s)
         text = (p.stdout + "\n" + p.stderr).strip()
         return (p.returncode == 0, text)
     except Exception as ex:
         return (False, str(ex))
 
 
+def sha256_file(path: pathlib.Path) -> Optional[str]:
+    try:
+        with path.open("rb") as fh:
+            if hasattr(hashlib, "file_digest"):
+                # 3.11+: hashes straight from the fd without Python-level chunking.
+                return hashlib.file_digest(fh, "sha256").hexdigest()
+            h = hashlib.sha256()
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                h.update(chunk)
+            return h.hexdigest()
+    except Exception:
+        return None
+
+
 def ensure_dir(path: pathlib.Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
@@ -148,40 +208,133 @@ def run_osascript(script: str, timeout_s: float = 12.0) -> subprocess.CompletedP
 
 # ---------- telemetry ----------
 
-def wait_for_new_jsonl(
-    path: pathlib.Path,
-    offset: int,
-    timeout_s: float,
-    predicate,
-) -> Tuple[Dict[str, Any], int]:
-    deadline = time.time() + timeout_s
-    cur = offset
-    while time.time() < deadline:
-        if path.exists():
-            data = path.read_bytes()
-            # File may be replaced/truncated by telemetry fallback writes; reset cursor.
-            if len(data) < cur:
-                cur = 0
-            if len(data) > cur:
-                tail = data[cur:]
-                # consume line by line
-                while True:
-                    nl = tail.find(b"\n")
-                    if nl < 0:
-                        break
-                    line = tail[:nl].decode("utf-8", errors="replace").strip()
-                    cur += nl + 1
-                    tail = tail[nl + 1:]
-                    if not line:
-                        continue
-                    try:
-                        obj = json.loads(line)
-                    except Exception:
-                        continue
-                    if predicate(obj):
-                        return obj, cur
-        time.sleep(0.02)
-    raise TimeoutError(f"timed out waiting for telemetry record at {path}")
+class JSONLTailer:
+    """Incremental reader for an append-only JSONL file.
+
+    Holds one fd open and only reads bytes past the cursor. Between reads it
+    blocks on a kqueue vnode filter (macOS) instead of sleeping on a fixed poll,
+    so a new line is observed at kernel wake latency.
+    """
+
+    # Upper bound on a single kqueue/poll sleep so a replaced file is noticed.
+    _MAX_BLOCK_S = 0.05
+    _POLL_S = 0.02
+
+    def __init__(self, path: pathlib.Path, offset: Optional[int] = None):
+        self.path = path
+        self.fd: Optional[int] = None
+        self.ino: Optional[int] = None
+        self.cur = 0
+        self.residual = b""
+        self.pending: collections.deque[bytes] = collections.deque()
+        self.kq: Any = None
+        self._open(offset)
+
+    def _open(self, offset: Optional[int]) -> None:
+        self.close()
+        self.cur = 0
+        try:
+            fd = os.open(str(self.path), os.O_RDONLY)
+        except OSError:
+            return
+        st = os.fstat(fd)
+        self.fd = fd
+        self.ino = st.st_ino
+        self.cur = st.st_size if offset is None else min(max(0, offset), st.st_size)
+        if hasattr(select, "kqueue"):
+            try:
+                kq = select.kqueue()
+                kq.control([
+                    select.kevent(
+                        fd,
+                        filter=select.KQ_FILTER_VNODE,
+                        flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                        fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME,
+                    )
+                ], 0)
+                self.kq = kq
+            except OSError:
+                self.kq = None
+
+    def close(self) -> None:
+        if self.kq is not None:
+            try:
+                self.kq.close()
+            except Exception:
+                pass
+            self.kq = None
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+        self.residual = b""
+        self.pending.clear()
+
+    def _replaced(self) -> bool:
+        try:
+            return os.stat(self.path).st_ino != self.ino
+        except OSError:
+            return False
+
+    def _read_new(self) -> None:
+        # File may be replaced/truncated by telemetry fallback writes; reset cursor.
+        if self.fd is None or self._replaced():
+            self._open(0)
+            if self.fd is None:
+                return
+        size = os.fstat(self.fd).st_size
+        if size < self.cur:
+            self.cur = 0
+            self.residual = b""
+            self.pending.clear()
+        if size == self.cur:
+            return
+        data = os.pread(self.fd, size - self.cur, self.cur)
+        self.cur += len(data)
+        # Usually the previous read ended on a newline; skip the concat copy then.
+        lines = (self.residual + data if self.residual else data).split(b"\n")
+        self.residual = lines.pop()
+        self.pending.extend(lines)
+
+    def mark(self) -> None:
+        """Skip everything written so far; later waits only see newer records."""
+        self._read_new()
+        self.pending.clear()
+        self.residual = b""
+
+    def _next_line(self) -> Optional[bytes]:
+        if not self.pending:
+            self._read_new()
+        while self.pending:
+            line = self.pending.popleft()
+            if line and not line.isspace():
+                return line
+        return None
+
+    def _block(self, remaining_s: float) -> None:
+        if self.kq is not None:
+            self.kq.control(None, 1, min(remaining_s, self._MAX_BLOCK_S))
+        else:
+            time.sleep(min(remaining_s, self._POLL_S))
+
+    def wait(self, timeout_s: float, predicate) -> Dict[str, Any]:
+        deadline = time.monotonic() + timeout_s
+        while True:
+            line = self._next_line()
+            while line is not None:
+                try:
+                    obj = json_loads(line)
+                except Exception:
+                    obj = None
+                if isinstance(obj, dict) and predicate(obj):
+                    return obj
+                line = self._next_line()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"timed out waiting for telemetry record at {self.path}")
+            self._block(remaining)
 
 
 # ---------- RPC ----------
@@ -191,12 +344,17 @@ class JSONRPCSocketClient:
         self.sock_path = sock_path
         self.timeout_s = timeout_s
         self.sock: Optional[socket.socket] = None
+        # Receive buffer filled in place via recv_into; bytes past the current
+        # frame are kept for the next _recv_obj call.
+        self._rbuf = bytearray(8192)
+        self._rfilled = 0
 
     def __enter__(self):
         s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         s.settimeout(self.timeout_s)
         s.connect(str(self.sock_path))
         self.sock = s
+        self._rfilled = 0
         return self
 
     def __exit__(self, exc_type, exc, tb):
@@ -209,38 +367,62 @@ class JSONRPCSocketClient:
 
     def _send_obj(self, obj: Dict[str, Any]) -> None:
         assert self.sock is not None
-        payload = json.dumps(obj, separators=(",", ":")).encode("utf-8")
+        payload = json_compact(obj)
         header = f"Content-Length: {len(payload)}\r\n\r\n".encode("ascii")
-        self.sock.sendall(header + payload)
+        # Gather-write header and payload from their own buffers instead of
+        # copying the body into a concatenated frame; resume after short writes.
+        bufs = [memoryview(header), memoryview(payload)]
+        while bufs:
+            sent = self.sock.sendmsg(bufs)
+            while sent and bufs:
+                if sent >= len(bufs[0]):
+                    sent -= len(bufs.pop(0))
+                else:
+                    bufs[0] = bufs[0][sent:]
+                    sent = 0
+
+    def _fill(self, deadline: float, what: str, need: int = 0) -> None:
+        assert self.sock is not None
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"timed out reading JSON-RPC {what}")
+        free = len(self._rbuf) - self._rfilled
+        if free < 4096 or need > len(self._rbuf):
+            self._rbuf.extend(bytes(max(len(self._rbuf), need - len(self._rbuf))))
+        n = self.sock.recv_into(memoryview(self._rbuf)[self._rfilled:])
+        if not n:
+            raise ConnectionError(f"socket closed while reading {what}")
+        self._rfilled += n
 
     def _recv_obj(self) -> Dict[str, Any]:
         assert self.sock is not None
-        buf = b""
-        deadline = time.time() + self.timeout_s
-        while b"\r\n\r\n" not in buf:
-            if time.time() > deadline:
-                raise TimeoutError("timed out reading JSON-RPC headers")
-            chunk = self.sock.recv(4096)
-            if not chunk:
-                raise ConnectionError("socket closed while reading headers")
-            buf += chunk
-        head, rest = buf.split(b"\r\n\r\n", 1)
+        deadline = time.monotonic() + self.timeout_s
+        scan = 0
+        while True:
+            header_end = self._rbuf.find(b"\r\n\r\n", scan, self._rfilled)
+            if header_end >= 0:
+                break
+            scan = max(0, self._rfilled - 3)
+            self._fill(deadline, "headers")
         length = None
-        for line in head.decode("ascii", errors="replace").split("\r\n"):
+        for line in self._rbuf[:header_end].decode("ascii", errors="replace").split("\r\n"):
             if line.lower().startswith("content-length:"):
                 length = int(line.split(":", 1)[1].strip())
                 break
         if length is None:
             raise ValueError("missing content-length header")
-        while len(rest) < length:
-            if time.time() > deadline:
-                raise TimeoutError("timed out reading JSON-RPC payload")
-            chunk = self.sock.recv(4096)
-            if not chunk:
-                raise ConnectionError("socket closed while reading payload")
-            rest += chunk
-        payload = rest[:length]
-        return json.loads(payload.decode("utf-8", errors="replace"))
+        body_start = header_end + 4
+        frame_end = body_start + length
+        while self._rfilled < frame_end:
+            self._fill(deadline, "payload", need=frame_end)
+        payload = self._rbuf[body_start:frame_end]
+        rest = self._rfilled - frame_end
+        self._rbuf[:rest] = self._rbuf[frame_end:self._rfilled]
+        self._rfilled = rest
+        try:
+            return json_loads(payload)
+        except ValueError:
+            # orjson rejects invalid UTF-8 outright; keep the lenient decode.
+            return json.loads(payload.decode("utf-8", errors="replace"))
 
     def request(self, req_id: int, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         req = {"jsonrpc": "2.0", "id": req_id, "method": method}
@@ -269,12 +451,39 @@ def send_session_close(sock_path: pathlib.Path, session_id: str, timeout_s: floa
 
 # ---------- cleanup / preconditions ----------
 
+def spawn_quiet(argv: List[str]) -> int:
+    # posix_spawn avoids forking the interpreter; stdout/stderr go to /dev/null.
+    return os.posix_spawn(
+        argv[0],
+        argv,
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+        ],
+    )
+
+
 def kill_turbodraft(socket_path: pathlib.Path, app_bin: pathlib.Path) -> None:
-    subprocess.run(["pkill", "-9", "-f", str(app_bin)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    pkill = shutil.which("pkill") or "/usr/bin/pkill"
     # Fallbacks for LaunchAgent/symlinked executables where argv may not include
-    # the resolved build path.
-    subprocess.run(["pkill", "-9", "-x", "turbodraft-app"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    subprocess.run(["pkill", "-9", "-x", "turbodraft-app.debug"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # the resolved build path. The three pkill calls are independent, so launch
+    # them together and reap once instead of paying each spawn serially.
+    pids: List[int] = []
+    for argv in (
+        [pkill, "-9", "-f", str(app_bin)],
+        [pkill, "-9", "-x", "turbodraft-app"],
+        [pkill, "-9", "-x", "turbodraft-app.debug"],
+    ):
+        try:
+            pids.append(spawn_quiet(argv))
+        except OSError:
+            pass
+    for pid in pids:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
     try:
         socket_path.unlink(missing_ok=True)
     except Exception:
@@ -289,7 +498,7 @@ def preconditions(repo: pathlib.Path, turbodraft_bin: pathlib.Path, app_bin: pat
     if not app_bin.exists():
         problems.append(f"missing binary: {app_bin}")
 
-    ok_status, status_out = shell_ok(f"cd {shlex.quote(str(repo))} && scripts/turbodraft-launch-agent status", timeout_s=10.0)
+    ok_status, status_out = argv_ok([str(repo / "scripts/turbodraft-launch-agent"), "status"], cwd=repo, timeout_s=10.0)
 
     if problems:
         raise SystemExit("precondition failed: " + "; ".join(problems))
@@ -461,13 +670,53 @@ class CycleAttemptResult:
     cycle: Dict[str, Any]
 
 
+@dataclass
+class CycleTimestamps:
+    trigger_ns: Optional[int] = None
+    open_event_received_ns: Optional[int] = None
+    close_trigger_ns: Optional[int] = None
+    proc_exit_ns: Optional[int] = None
+    wait_event_received_ns: Optional[int] = None
+
+    def to_json(self) -> Dict[str, int]:
+        # Failed attempts only report the stages they reached.
+        return {k: v for k, v in vars(self).items() if v is not None}
+
+
+def wait_process_exit(proc: subprocess.Popen[str], timeout_s: float) -> None:
+    # Popen.wait(timeout=...) sleep-polls with up to 50ms backoff, which would
+    # quantize close->exit timings. kqueue delivers NOTE_EXIT as it happens.
+    if proc.poll() is not None:
+        return
+    if not hasattr(select, "kqueue"):
+        proc.wait(timeout=timeout_s)
+        return
+    kq = select.kqueue()
+    try:
+        try:
+            kq.control(
+                [select.kevent(proc.pid, filter=select.KQ_FILTER_PROC, flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT, fflags=select.KQ_NOTE_EXIT)],
+                0,
+            )
+        except ProcessLookupError:
+            # Already exiting; the reap below returns promptly.
+            pass
+        else:
+            if not kq.control(None, 1, max(0.0, timeout_s)) and proc.poll() is None:
+                raise subprocess.TimeoutExpired(proc.args, timeout_s)
+    finally:
+        kq.close()
+    # The child has exited, so a blocking reap does not wait on anything.
+    proc.wait()
+
+
 def run_api_cycle_attempt(
     cycle_idx: int,
     attempt_idx: int,
     fixture_path: pathlib.Path,
     turbodraft_bin: pathlib.Path,
     socket_path: pathlib.Path,
-    telemetry_path: pathlib.Path,
+    tailer: JSONLTailer,
     open_timeout_s: float,
     close_timeout_s: float,
 ) -> CycleAttemptResult:
@@ -479,22 +728,18 @@ def run_api_cycle_attempt(
         "timestamps": {},
         "validation": {"ordering_ok": True, "ordering_errors": []},
     }
-    telemetry_offset = telemetry_path.stat().st_size if telemetry_path.exists() else 0
+    ts = CycleTimestamps()
+    tailer.mark()
 
     cmd = [str(turbodraft_bin), "open", "--path", str(fixture_path), "--wait", "--timeout-ms", str(int(max(1000, (open_timeout_s + close_timeout_s) * 1000)))]
     t_trigger = time.perf_counter()
     proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
-    cycle["timestamps"]["trigger_ns"] = time.perf_counter_ns()
+    ts.trigger_ns = time.perf_counter_ns()
 
     try:
-        open_evt, telemetry_offset = wait_for_new_jsonl(
-            telemetry_path,
-            telemetry_offset,
-            timeout_s=open_timeout_s,
-            predicate=lambda o: o.get("event") == "cli_open",
-        )
+        open_evt = tailer.wait(timeout_s=open_timeout_s, predicate=lambda o: o.get("event") == "cli_open")
         cycle["openTelemetry"] = open_evt
-        cycle["timestamps"]["open_event_received_ns"] = time.perf_counter_ns()
+        ts.open_event_received_ns = time.perf_counter_ns()
 
         # Close trigger via RPC session.close when possible (keeps app resident).
         # Fallback to app.quit for backward compatibility if session id telemetry
@@ -507,21 +752,16 @@ def run_api_cycle_attempt(
         else:
             close_rpc_ms = send_app_quit(socket_path, timeout_s=max(1.0, close_timeout_s))
             cycle["closeMethod"] = "appQuit"
-        cycle["timestamps"]["close_trigger_ns"] = close_trigger_ns
+        ts.close_trigger_ns = close_trigger_ns
         cycle["closeRpcRoundtripMs"] = close_rpc_ms
 
         # Primary close metric: close trigger -> open command process exit.
-        proc.wait(timeout=max(1.0, close_timeout_s))
-        cycle["timestamps"]["proc_exit_ns"] = time.perf_counter_ns()
-
-        wait_evt, telemetry_offset = wait_for_new_jsonl(
-            telemetry_path,
-            telemetry_offset,
-            timeout_s=close_timeout_s,
-            predicate=lambda o: o.get("event") == "cli_wait",
-        )
+        wait_process_exit(proc, timeout_s=max(1.0, close_timeout_s))
+        ts.proc_exit_ns = time.perf_counter_ns()
+
+        wait_evt = tailer.wait(timeout_s=close_timeout_s, predicate=lambda o: o.get("event") == "cli_wait")
         cycle["waitTelemetry"] = wait_evt
-        cycle["timestamps"]["wait_event_received_ns"] = time.perf_counter_ns()
+        ts.wait_event_received_ns = time.perf_counter_ns()
 
         stderr = (proc.stderr.read() if proc.stderr else "").strip()
         cycle["returnCode"] = int(proc.returncode)
@@ -534,10 +774,10 @@ def run_api_cycle_attempt(
         cycle["apiOpenRpcMs"] = numeric(open_evt.get("rpcOpenMs"))
         cycle["apiCloseWaitMs"] = numeric(wait_evt.get("waitMs"))
         cycle["apiCloseTriggerToWaitEventMs"] = (
-            float(cycle["timestamps"]["wait_event_received_ns"] - close_trigger_ns) / 1_000_000.0
+            float(ts.wait_event_received_ns - close_trigger_ns) / 1_000_000.0
         )
         cycle["apiCloseTriggerToExitMs"] = (
-            float(cycle["timestamps"]["proc_exit_ns"] - close_trigger_ns) / 1_000_000.0
+            float(ts.proc_exit_ns - close_trigger_ns) / 1_000_000.0
         )
         cycle["apiCloseWaitObservationLagMs"] = (
             cycle["apiCloseTriggerToWaitEventMs"] - cycle["apiCloseTriggerToExitMs"]
@@ -546,16 +786,15 @@ def run_api_cycle_attempt(
 
         # Ordering validation
         ord_errs: List[str] = []
-        ts = cycle["timestamps"]
-        if ts["trigger_ns"] > ts["open_event_received_ns"]:
+        if ts.trigger_ns > ts.open_event_received_ns:
             ord_errs.append("trigger_after_open_event")
-        if ts["open_event_received_ns"] > ts["close_trigger_ns"]:
+        if ts.open_event_received_ns > ts.close_trigger_ns:
             ord_errs.append("open_event_after_close_trigger")
-        if ts["close_trigger_ns"] > ts["proc_exit_ns"]:
+        if ts.close_trigger_ns > ts.proc_exit_ns:
             ord_errs.append("close_trigger_after_proc_exit")
-        if ts["proc_exit_ns"] > ts["wait_event_received_ns"]:
+        if ts.proc_exit_ns > ts.wait_event_received_ns:
             ord_errs.append("proc_exit_after_wait_event")
-        if ts["close_trigger_ns"] > ts["wait_event_received_ns"]:
+        if ts.close_trigger_ns > ts.wait_event_received_ns:
             ord_errs.append("close_trigger_after_wait_event")
         cycle["validation"]["ordering_errors"] = ord_errs
         cycle["validation"]["ordering_ok"] = len(ord_errs) == 0
@@ -594,6 +833,8 @@ def run_api_cycle_attempt(
         cycle["error"] = str(ex)
         cycle["ok"] = False
         return CycleAttemptResult(False, True, "exception", cycle)
+    finally:
+        cycle["timestamps"] = ts.to_json()
 
 
 def collect_ui_probe_cycle(
@@ -625,22 +866,20 @@ def collect_ui_probe_cycle(
 
 # ---------- reporting ----------
 
-def metric_samples(cycles: List[Dict[str, Any]], key: str) -> List[float]:
-    out: List[float] = []
-    for c in cycles:
-        x = numeric(c.get(key))
-        if x is not None:
-            out.append(x)
-    return out
-
-
-def metric_samples_with_cycle(cycles: List[Dict[str, Any]], key: str) -> List[Tuple[int, float]]:
-    out: List[Tuple[int, float]] = []
+def metric_columns(cycles: List[Dict[str, Any]], fields: Dict[str, Tuple[str, ...]]) -> Dict[str, List[Tuple[int, float]]]:
+    # One pass over the cycles for every field, instead of one pass per field.
+    # Each field is a key path into the cycle dict, e.g. ("uiProbe", "openVisibleMs").
+    cols: Dict[str, List[Tuple[int, float]]] = {name: [] for name in fields}
     for c in cycles:
-        x = numeric(c.get(key))
-        if x is not None:
-            out.append((int(c.get("cycle", 0)), x))
-    return out
+        idx = int(c.get("cycle", 0))
+        for name, path in fields.items():
+            v: Any = c
+            for k in path:
+                v = v.get(k) if isinstance(v, dict) else None
+            x = numeric(v)
+            if x is not None:
+                cols[name].append((idx, x))
+    return cols
 
 
 def print_table(title: str, stats: Dict[str, Any]) -> None:
@@ -661,10 +900,17 @@ def print_table(title: str, stats: Dict[str, Any]) -> None:
 
 
 def build_metadata(repo: pathlib.Path, args: argparse.Namespace, binaries: Dict[str, pathlib.Path], precheck: Dict[str, Any]) -> Dict[str, Any]:
-    model_ok, model = shell_ok("sysctl -n hw.model", timeout_s=4.0)
-    sw_ok, sw_out = shell_ok("sw_vers", timeout_s=4.0)
-    git_ok, git_rev = shell_ok(f"cd {shlex.quote(str(repo))} && git rev-parse --short HEAD", timeout_s=4.0)
-    app_hash_ok, app_hash = shell_ok(f"shasum -a 256 {shlex.quote(str(binaries['app']))} | awk '{{print $1}}'", timeout_s=4.0)
+    # Metadata probes are independent; run them concurrently so the report
+    # pays for the slowest probe rather than the sum of all four.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        model_f = pool.submit(argv_ok, ["sysctl", "-n", "hw.model"], 4.0)
+        sw_f = pool.submit(argv_ok, ["sw_vers"], 4.0)
+        git_f = pool.submit(argv_ok, ["git", "-C", str(repo), "rev-parse", "--short", "HEAD"], 4.0)
+        hash_f = pool.submit(sha256_file, binaries["app"])
+        model_ok, model = model_f.result()
+        sw_ok, sw_out = sw_f.result()
+        git_ok, git_rev = git_f.result()
+        app_hash = hash_f.result()
 
     out = {
         "timestamp": now_iso(),
@@ -677,7 +923,7 @@ def build_metadata(repo: pathlib.Path, args: argparse.Namespace, binaries: Dict[
         "gitRevision": git_rev if git_ok else None,
         "appBinary": str(binaries["app"]),
         "benchBinary": str(binaries["bench"]),
-        "appBinarySha256": app_hash if app_hash_ok else None,
+        "appBinarySha256": app_hash,
         "args": vars(args),
         "environment": {
             "TURBODRAFT_SOCKET": os.environ.get("TURBODRAFT_SOCKET"),
@@ -695,7 +941,7 @@ def compare_with_previous(current: Dict[str, Any], previous_path: Optional[pathl
     if previous_path is None or not previous_path.exists():
         return {"available": False, "path": str(previous_path) if previous_path else None, "metrics": {}}
     try:
-        prev = json.loads(previous_path.read_text(encoding="utf-8"))
+        prev = json_loads(previous_path.read_bytes())
     except Exception as ex:
         return {"available": False, "path": str(previous_path), "error": str(ex), "metrics": {}}
 
@@ -739,6 +985,12 @@ def main() -> int:
     ap.add_argument("--fixture", default="bench/preambles/core.md")
     ap.add_argument("--out-dir", default="")
     ap.add_argument("--compare", default="", help="Optional previous report JSON for trend deltas")
+    ap.add_argument(
+        "--split-cycles",
+        action="store_true",
+        default=False,
+        help="Reference cycles.jsonl from report.json (cyclesFile) instead of embedding the cycle list",
+    )
     args = ap.parse_args()
 
     if args.cycles <= 0:
@@ -769,6 +1021,23 @@ def main() -> int:
     failures: List[Dict[str, Any]] = []
     transient_failure_injected = False
     transient_failure_recovered = False
+    # One tailer for the whole run: the cursor advances across cycles instead
+    # of re-stat'ing the telemetry file at every attempt.
+    tailer = JSONLTailer(telemetry_path)
+    # Raw cycles are streamed as they finish so an aborted run still leaves data
+    # behind. Each pre-encoded line goes straight to write(2) on a held fd.
+    raw_jsonl = out_dir / "cycles.jsonl"
+    raw_fd = os.open(str(raw_jsonl), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+    def record_cycle(cycle: Dict[str, Any]) -> None:
+        cycles.append(cycle)
+        buf = memoryview(jsonl_line(cycle))
+        while buf:
+            buf = buf[os.write(raw_fd, buf):]
+
+    # Retry backoff and inter-cycle delay are deadlines rather than fixed sleeps:
+    # bookkeeping and clean-slate teardown count toward them.
+    resume_at = 0.0
 
     try:
         for idx in range(1, args.cycles + 1):
@@ -797,13 +1066,17 @@ def main() -> int:
                 if args.clean_slate:
                     kill_turbodraft(socket_path, app_bin)
 
+                slack = resume_at - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
+
                 res = run_api_cycle_attempt(
                     cycle_idx=idx,
                     attempt_idx=attempt,
                     fixture_path=fixture,
                     turbodraft_bin=bench_bin,
                     socket_path=socket_path,
-                    telemetry_path=telemetry_path,
+                    tailer=tailer,
                     open_timeout_s=float(args.open_timeout_s),
                     close_timeout_s=float(args.close_timeout_s),
                 )
@@ -816,7 +1089,7 @@ def main() -> int:
                     if transient_failure_injected and idx == args.inject_transient_failure_cycle and attempt > 1:
                         transient_failure_recovered = True
                     final_cycle["ok"] = True
-                    cycles.append(final_cycle)
+                    record_cycle(final_cycle)
                     break
 
                 failures.append({
@@ -828,21 +1101,19 @@ def main() -> int:
                 })
 
                 if attempt <= args.retries:
-                    time.sleep(0.10)
+                    resume_at = time.monotonic() + 0.10
 
             if not cycle_success:
                 final_cycle["ok"] = False
                 final_cycle["warmup"] = warmup
-                cycles.append(final_cycle)
+                record_cycle(final_cycle)
 
-            time.sleep(max(0.0, float(args.inter_cycle_delay_s)))
+            resume_at = time.monotonic() + max(0.0, float(args.inter_cycle_delay_s))
     finally:
-        pass
+        tailer.close()
+        os.close(raw_fd)
 
     # validation & summaries
-    successful = [c for c in cycles if c.get("ok")]
-    steady = [c for c in successful if not c.get("warmup")]
-
     primary_keys = [
         "apiOpenTotalMs",
         "apiCloseTriggerToExitMs",
@@ -854,41 +1125,61 @@ def main() -> int:
         "apiCloseWaitMs",
         "apiCloseWaitObservationLagMs",
     ]
-    ui_keys = ["ui_open_visible_ms", "ui_close_cmd_to_disappear_ms"]
+    ui_fields = {
+        "ui_open_visible_ms": ("uiProbe", "openVisibleMs"),
+        "ui_close_cmd_to_disappear_ms": ("uiProbe", "closeCommandToDisappearMs"),
+    }
 
-    # Flatten UI fields for summary convenience.
+    # One pass: partition cycles and count validation/coverage stats.
+    successful: List[Dict[str, Any]] = []
+    steady: List[Dict[str, Any]] = []
+    ordering_errors = 0
+    ui_attempted = 0
+    ui_ok = 0
+    unrecovered_failures = 0
     for c in cycles:
-        p = c.get("uiProbe") or {}
-        c["ui_open_visible_ms"] = numeric(p.get("openVisibleMs"))
-        c["ui_close_cmd_to_disappear_ms"] = numeric(p.get("closeCommandToDisappearMs"))
+        ok = c.get("ok")
+        warmup = c.get("warmup")
+        probe = c.get("uiProbe")
+        if ok:
+            successful.append(c)
+            if not warmup:
+                steady.append(c)
+            if not (c.get("validation") or {}).get("ordering_ok", True):
+                ordering_errors += 1
+        else:
+            unrecovered_failures += 1
+        if probe is not None and not warmup:
+            ui_attempted += 1
+            if probe.get("ok") is True:
+                ui_ok += 1
 
     summary_steady: Dict[str, Any] = {}
     summary_all: Dict[str, Any] = {}
     outliers: Dict[str, Any] = {}
 
-    for key in primary_keys + ui_keys:
-        s_all = metric_samples(cycles, key)
-        s_steady = metric_samples(steady, key)
+    summary_fields: Dict[str, Tuple[str, ...]] = {k: (k,) for k in primary_keys}
+    summary_fields.update(ui_fields)
+    cols_all = metric_columns(cycles, summary_fields)
+    cols_steady = metric_columns(steady, summary_fields)
+    for key in summary_fields:
+        s_all = [v for _, v in cols_all[key]]
+        s_steady = [v for _, v in cols_steady[key]]
+        s_steady_sorted = sorted(s_steady)
         summary_all[key] = summarize(s_all)
-        summary_steady[key] = summarize(s_steady)
-        outliers[key] = detect_outliers_iqr(metric_samples_with_cycle(steady, key))
-
-    ordering_errors = [c for c in successful if not ((c.get("validation") or {}).get("ordering_ok", True))]
+        summary_steady[key] = summarize(s_steady, sorted_vals=s_steady_sorted)
+        outliers[key] = detect_outliers_iqr(cols_steady[key], sorted_vals=s_steady_sorted)
 
     primary_counts_ok = True
     for key in ["apiOpenTotalMs", "apiCloseTriggerToExitMs"]:
-        cnt = len(metric_samples(steady, key))
+        cnt = len(cols_steady[key])
         if cnt != len(steady):
             primary_counts_ok = False
 
-    ui_attempted = len([c for c in cycles if c.get("uiProbe") is not None and not c.get("warmup")])
-    ui_ok = len([c for c in cycles if not c.get("warmup") and (c.get("uiProbe") or {}).get("ok") is True])
     ui_coverage = (ui_ok / ui_attempted) if ui_attempted else None
 
-    unrecovered_failures = len([c for c in cycles if not c.get("ok")])
-
     validation = {
-        "timestamp_ordering_ok": len(ordering_errors) == 0,
+        "timestamp_ordering_ok": ordering_errors == 0,
         "primary_sample_count_ok": primary_counts_ok,
         "steady_state_cycle_count": len(steady),
         "successful_cycle_count": len(successful),
@@ -928,7 +1219,7 @@ def main() -> int:
             "socketPath": str(socket_path),
             "telemetryPath": str(telemetry_path),
         },
-        "cycles": cycles,
+        **({"cyclesFile": raw_jsonl.name} if args.split_cycles else {"cycles": cycles}),
         "failures": failures,
         "summary": {
             "allCycles": summary_all,
@@ -965,12 +1256,7 @@ def main() -> int:
     )
 
     out_json = out_dir / "report.json"
-    out_json.write_text(json.dumps(report, indent=2), encoding="utf-8")
-
-    raw_jsonl = out_dir / "cycles.jsonl"
-    with raw_jsonl.open("w", encoding="utf-8") as fh:
-        for c in cycles:
-            fh.write(json.dumps(c) + "\n")
+    out_json.write_bytes(json_pretty(report))
 
     # console summary
     print("open_close_report\t" + str(out_json))
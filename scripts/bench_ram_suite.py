@@ -2,29 +2,60 @@
 from __future__ import annotations
 
 import argparse
+import collections
+import ctypes
 import datetime as dt
+import io
 import json
 import math
 import os
 import pathlib
 import platform
 import random
-import shlex
+import select
+import shutil
+import signal
 import socket
-import statistics
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def jsonl_line(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def json_pretty(obj: Any) -> bytes:
+    # Keys are written in construction order; the report is built in a fixed
+    # layout, so the output stays stable without sorting every nested dict.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
 
 
 # ---------- stats ----------
 
-def percentile_nearest_rank(samples: List[float], p: float) -> Optional[float]:
-    if not samples:
+def nearest_rank_sorted(xs: List[float], p: float) -> Optional[float]:
+    if not xs:
         return None
-    xs = sorted(float(x) for x in samples)
     clamped = max(0.0, min(1.0, float(p)))
     if clamped <= 0.0:
         return xs[0]
@@ -32,7 +63,13 @@ def percentile_nearest_rank(samples: List[float], p: float) -> Optional[float]:
     return xs[idx]
 
 
-def summarize(samples: List[float]) -> Dict[str, Any]:
+def median_sorted(xs: List[float]) -> float:
+    n = len(xs)
+    mid = n // 2
+    return xs[mid] if n % 2 else (xs[mid - 1] + xs[mid]) / 2.0
+
+
+def summarize(samples: List[float], sorted_vals: Optional[List[float]] = None) -> Dict[str, Any]:
     if not samples:
         return {
             "n": 0,
@@ -42,22 +79,24 @@ def summarize(samples: List[float]) -> Dict[str, Any]:
             "max": None,
             "mean": None,
         }
+    xs = sorted_vals if sorted_vals is not None else sorted(float(x) for x in samples)
+    n = len(xs)
     return {
-        "n": len(samples),
-        "min": float(min(samples)),
-        "median": float(statistics.median(samples)),
-        "p95": percentile_nearest_rank(samples, 0.95),
-        "max": float(max(samples)),
-        "mean": float(statistics.mean(samples)),
+        "n": n,
+        "min": xs[0],
+        "median": float(median_sorted(xs)),
+        "p95": nearest_rank_sorted(xs, 0.95),
+        "max": xs[-1],
+        "mean": math.fsum(xs) / n,
     }
 
 
-def detect_outliers_iqr(samples: List[Tuple[int, float]]) -> Dict[str, Any]:
+def detect_outliers_iqr(samples: List[Tuple[int, float]], sorted_vals: Optional[List[float]] = None) -> Dict[str, Any]:
     if len(samples) < 4:
         return {"method": "iqr_1.5", "low": None, "high": None, "cycles": []}
-    vals = sorted(v for _, v in samples)
-    q1 = percentile_nearest_rank(vals, 0.25)
-    q3 = percentile_nearest_rank(vals, 0.75)
+    vals = sorted_vals if sorted_vals is not None else sorted(v for _, v in samples)
+    q1 = nearest_rank_sorted(vals, 0.25)
+    q3 = nearest_rank_sorted(vals, 0.75)
     if q1 is None or q3 is None:
         return {"method": "iqr_1.5", "low": None, "high": None, "cycles": []}
     iqr = q3 - q1
@@ -70,15 +109,22 @@ def detect_outliers_iqr(samples: List[Tuple[int, float]]) -> Dict[str, Any]:
 def linear_slope_per_cycle(samples: List[Tuple[int, float]]) -> Optional[float]:
     if len(samples) < 2:
         return None
-    xs = [float(i) for i, _ in samples]
-    ys = [float(v) for _, v in samples]
-    mx = statistics.mean(xs)
-    my = statistics.mean(ys)
-    den = sum((x - mx) ** 2 for x in xs)
-    if den <= 0:
+    # Welford-style single pass: running means plus centered co-moments, which
+    # stays stable for near-constant resident sizes without a second pass.
+    n = 0
+    mx = my = 0.0
+    sxx = sxy = 0.0
+    for i, v in samples:
+        x = float(i)
+        n += 1
+        dx = x - mx
+        mx += dx / n
+        my += (float(v) - my) / n
+        sxx += dx * (x - mx)
+        sxy += dx * (float(v) - my)
+    if sxx <= 0:
         return None
-    num = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
-    return num / den
+    return sxy / sxx
 
 
 # ---------- helpers ----------
@@ -93,15 +139,6 @@ def to_mib(bytes_value: Optional[float]) -> Optional[float]:
     return float(bytes_value) / (1024.0 * 1024.0)
 
 
-def shell_ok(cmd: str, timeout_s: float = 8.0) -> Tuple[bool, str]:
-    try:
-        p = subprocess.run(["/bin/zsh", "-lc", cmd], text=True, capture_output=True, timeout=timeout_s)
-        text = (p.stdout + "\n" + p.stderr).strip()
-        return (p.returncode == 0, text)
-    except Exception as ex:
-        return (False, str(ex))
-
-
 def ensure_dir(path: pathlib.Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
@@ -129,38 +166,152 @@ def resolve_socket_path() -> pathlib.Path:
     return default_app_support_dir() / "turbodraft.sock"
 
 
-def wait_for_new_jsonl(path: pathlib.Path, offset: int, timeout_s: float, predicate) -> Tuple[Dict[str, Any], int]:
-    deadline = time.time() + timeout_s
+def _watch_appends(fd: int) -> Any:
+    # kqueue vnode filter (macOS) for writes/extends on fd; None where unavailable.
+    if not hasattr(select, "kqueue"):
+        return None
+    try:
+        kq = select.kqueue()
+        kq.control([
+            select.kevent(
+                fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME,
+            )
+        ], 0)
+        return kq
+    except OSError:
+        return None
+
+
+def is_cli_open(o: Dict[str, Any]) -> bool:
+    return o.get("event") == "cli_open"
+
+
+def is_cli_wait(o: Dict[str, Any]) -> bool:
+    return o.get("event") == "cli_wait"
+
+
+def wait_for_new_jsonl(
+    path: pathlib.Path,
+    offset: int,
+    timeout_s: float,
+    predicate,
+    prefilter: Optional[bytes] = None,
+) -> Tuple[Dict[str, Any], int]:
+    # prefilter: bytes a matching raw line must contain; lines without it are
+    # skipped before json.loads.
+    deadline = time.monotonic() + timeout_s
     cur = offset
-    while time.time() < deadline:
-        if path.exists():
-            data = path.read_bytes()
-            if len(data) < cur:
-                cur = 0
-            if len(data) > cur:
-                tail = data[cur:]
-                while True:
-                    nl = tail.find(b"\n")
-                    if nl < 0:
-                        break
-                    line = tail[:nl].decode("utf-8", errors="replace").strip()
-                    cur += nl + 1
-                    tail = tail[nl + 1:]
-                    if not line:
-                        continue
-                    try:
-                        obj = json.loads(line)
-                    except Exception:
-                        continue
-                    if predicate(obj):
-                        return obj, cur
-        time.sleep(0.01)
+    fh = None
+    ino = None
+    kq = None
+    try:
+        while time.monotonic() < deadline:
+            # Keep one handle open and only read bytes past the cursor; reopen if
+            # the file was replaced by a telemetry fallback write.
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is not None and (fh is None or st.st_ino != ino):
+                if kq is not None:
+                    kq.close()
+                    kq = None
+                if fh is not None:
+                    fh.close()
+                fh = path.open("rb")
+                ino = os.fstat(fh.fileno()).st_ino
+                kq = _watch_appends(fh.fileno())
+            if fh is not None:
+                size = os.fstat(fh.fileno()).st_size
+                if size < cur:
+                    cur = 0
+                if size > cur:
+                    fh.seek(cur)
+                    lines = fh.read(size - cur).split(b"\n")
+                    # The last element is an unterminated line (or empty); leave it
+                    # for the next read by not advancing past it.
+                    for raw in lines[:-1]:
+                        cur += len(raw) + 1
+                        line = raw.strip()
+                        if not line or (prefilter is not None and prefilter not in line):
+                            continue
+                        try:
+                            obj = json_loads(line)
+                        except Exception:
+                            continue
+                        if predicate(obj):
+                            return obj, cur
+            if kq is not None:
+                # Wake on the next append instead of polling; the cap keeps a
+                # replaced or not-yet-created file from going unnoticed.
+                kq.control(None, 1, max(0.0, min(0.05, deadline - time.monotonic())))
+            else:
+                time.sleep(0.01)
+    finally:
+        if kq is not None:
+            kq.close()
+        if fh is not None:
+            fh.close()
     raise TimeoutError(f"timed out waiting for telemetry record at {path}")
 
 
+class _ProcTaskInfo(ctypes.Structure):
+    # struct proc_taskinfo from <sys/proc_info.h>
+    _fields_ = [
+        ("pti_virtual_size", ctypes.c_uint64),
+        ("pti_resident_size", ctypes.c_uint64),
+        ("pti_total_user", ctypes.c_uint64),
+        ("pti_total_system", ctypes.c_uint64),
+        ("pti_threads_user", ctypes.c_uint64),
+        ("pti_threads_system", ctypes.c_uint64),
+        ("pti_policy", ctypes.c_int32),
+        ("pti_faults", ctypes.c_int32),
+        ("pti_pageins", ctypes.c_int32),
+        ("pti_cow_faults", ctypes.c_int32),
+        ("pti_messages_sent", ctypes.c_int32),
+        ("pti_messages_received", ctypes.c_int32),
+        ("pti_syscalls_mach", ctypes.c_int32),
+        ("pti_syscalls_unix", ctypes.c_int32),
+        ("pti_csw", ctypes.c_int32),
+        ("pti_threadnum", ctypes.c_int32),
+        ("pti_numrunning", ctypes.c_int32),
+        ("pti_priority", ctypes.c_int32),
+    ]
+
+
+_PROC_PIDTASKINFO = 4
+
+try:
+    _libproc = ctypes.CDLL("/usr/lib/libproc.dylib", use_errno=True)
+    _libproc.proc_pidinfo.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_uint64, ctypes.c_void_p, ctypes.c_int]
+    _libproc.proc_pidinfo.restype = ctypes.c_int
+except Exception:  # pragma: no cover - non-macOS
+    _libproc = None
+
+
+def _rss_bytes_libproc(pid: int) -> Optional[int]:
+    info = _ProcTaskInfo()
+    size = ctypes.sizeof(info)
+    n = _libproc.proc_pidinfo(pid, _PROC_PIDTASKINFO, 0, ctypes.byref(info), size)
+    if n < size:
+        return None
+    return int(info.pti_resident_size)
+
+
 def rss_bytes(pid: int) -> Optional[int]:
     if pid <= 0:
         return None
+    if _libproc is not None:
+        # Same task resident size `ps -o rss` reports, without a fork per sample.
+        try:
+            v = _rss_bytes_libproc(pid)
+        except Exception:
+            v = None
+        if v is not None:
+            return v
     try:
         cp = subprocess.run(["ps", "-o", "rss=", "-p", str(pid)], text=True, capture_output=True, timeout=1.5)
         if cp.returncode != 0:
@@ -177,13 +328,26 @@ def rss_bytes(pid: int) -> Optional[int]:
 
 def collect_rss_samples(pid: int, duration_s: float, sample_ms: float) -> List[int]:
     out: List[int] = []
-    deadline = time.time() + max(0.0, duration_s)
-    interval = max(0.001, float(sample_ms) / 1000.0)
-    while time.time() < deadline:
+    now = time.monotonic_ns()
+    deadline = now + int(max(0.0, duration_s) * 1e9)
+    interval = int(max(0.001, float(sample_ms) / 1000.0) * 1e9)
+    # Sample on an absolute schedule so a slow rss_bytes call does not push
+    # every later sample back.
+    next_tick = now
+    while now < deadline:
         v = rss_bytes(pid)
         if v is not None:
             out.append(v)
-        time.sleep(interval)
+        next_tick += interval
+        if next_tick >= deadline:
+            break
+        now = time.monotonic_ns()
+        if next_tick > now:
+            time.sleep((next_tick - now) / 1e9)
+            now = time.monotonic_ns()
+        else:
+            # Fell behind by more than a period; resync instead of bursting.
+            next_tick = now
     if not out:
         v = rss_bytes(pid)
         if v is not None:
@@ -191,31 +355,110 @@ def collect_rss_samples(pid: int, duration_s: float, sample_ms: float) -> List[i
     return out
 
 
+class RssPeakSampler(threading.Thread):
+    """Samples a pid's RSS on a fixed period in the background, keeping the peak."""
+
+    def __init__(self, pid: int, sample_ms: float):
+        super().__init__(name="rss-peak-sampler", daemon=True)
+        self.pid = pid
+        self.interval_s = max(0.001, float(sample_ms) / 1000.0)
+        self.peak: Optional[int] = None
+        self._halt = threading.Event()
+
+    def _sample(self) -> None:
+        v = rss_bytes(self.pid)
+        if v is not None and (self.peak is None or v > self.peak):
+            self.peak = v
+
+    def run(self) -> None:
+        next_tick = time.monotonic()
+        while True:
+            self._sample()
+            next_tick += self.interval_s
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick = now
+            if self._halt.wait(next_tick - now):
+                # Close the window with one last reading at stop time.
+                self._sample()
+                return
+
+    def stop(self) -> Optional[int]:
+        self._halt.set()
+        self.join()
+        return self.peak
+
+
 def deterministic_payload(cycle_idx: int, step_idx: int, target_bytes: int) -> str:
     header = f"\n\n# ram-cycle-{cycle_idx}-step-{step_idx}\n"
     seed = f"payload-{cycle_idx:03d}-{step_idx:03d} "
-    need = max(256, target_bytes - len(header.encode("utf-8")))
-    repeats = math.ceil(need / len(seed.encode("utf-8")))
+    # Both strings are ASCII, so len() is the UTF-8 byte length.
+    need = max(256, target_bytes - len(header))
+    repeats = -(-need // len(seed))
     body = (seed * repeats)[:need]
     return header + body
 
 
 # ---------- RPC ----------
 
+class _PolledSocketReader(io.RawIOBase):
+    """Raw reader over a non-blocking socket, waiting on one poll registration."""
+
+    def __init__(self, sock: socket.socket):
+        super().__init__()
+        self.sock = sock
+        self.deadline = math.inf
+        self._poll = select.poll()
+        self._poll.register(sock.fileno(), select.POLLIN)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while True:
+            try:
+                return self.sock.recv_into(b)
+            except BlockingIOError:
+                pass
+            remaining_ms = math.ceil((self.deadline - time.monotonic()) * 1000.0)
+            if remaining_ms <= 0 or not self._poll.poll(remaining_ms):
+                raise TimeoutError("timed out reading JSON-RPC frame")
+
+
 class JSONRPCSocketClient:
     def __init__(self, sock_path: pathlib.Path, timeout_s: float = 5.0):
         self.sock_path = sock_path
         self.timeout_s = timeout_s
         self.sock: Optional[socket.socket] = None
+        self.rfile: Optional[io.BufferedReader] = None
+        self._reader: Optional[_PolledSocketReader] = None
+        self._wpoll: Optional[Any] = None
+        self._next_id = 0
 
     def __enter__(self):
         s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         s.settimeout(self.timeout_s)
         s.connect(str(self.sock_path))
+        # From here on the socket stays non-blocking and every wait goes through
+        # poll objects registered once for the client's lifetime, with a deadline
+        # per frame rather than a timeout re-armed on each recv/send.
+        s.setblocking(False)
         self.sock = s
+        self._reader = _PolledSocketReader(s)
+        self.rfile = io.BufferedReader(self._reader, 65536)
+        self._wpoll = select.poll()
+        self._wpoll.register(s.fileno(), select.POLLOUT)
         return self
 
     def __exit__(self, exc_type, exc, tb):
+        if self.rfile:
+            try:
+                self.rfile.close()
+            except Exception:
+                pass
+            self.rfile = None
+        self._reader = None
+        self._wpoll = None
         if self.sock:
             try:
                 self.sock.close()
@@ -224,39 +467,54 @@ class JSONRPCSocketClient:
             self.sock = None
 
     def _send_obj(self, obj: Dict[str, Any]) -> None:
+        self._send_payload(json_compact(obj))
+
+    def _send_payload(self, payload: bytes) -> None:
         assert self.sock is not None
-        payload = json.dumps(obj, separators=(",", ":")).encode("utf-8")
         header = f"Content-Length: {len(payload)}\r\n\r\n".encode("ascii")
-        self.sock.sendall(header + payload)
+        assert self._wpoll is not None
+        deadline = time.monotonic() + self.timeout_s
+        # Large save bodies go out without a concatenated copy; a full socket
+        # buffer waits on POLLOUT within the frame deadline.
+        bufs = [memoryview(header), memoryview(payload)]
+        while bufs:
+            try:
+                sent = self.sock.sendmsg(bufs)
+            except BlockingIOError:
+                remaining_ms = math.ceil((deadline - time.monotonic()) * 1000.0)
+                if remaining_ms <= 0 or not self._wpoll.poll(remaining_ms):
+                    raise TimeoutError("timed out writing JSON-RPC frame")
+                continue
+            while sent and bufs:
+                if sent >= len(bufs[0]):
+                    sent -= len(bufs.pop(0))
+                else:
+                    bufs[0] = bufs[0][sent:]
+                    sent = 0
 
     def _recv_obj(self) -> Dict[str, Any]:
-        assert self.sock is not None
-        buf = b""
-        deadline = time.time() + self.timeout_s
-        while b"\r\n\r\n" not in buf:
-            if time.time() > deadline:
-                raise TimeoutError("timed out reading JSON-RPC headers")
-            chunk = self.sock.recv(4096)
-            if not chunk:
-                raise ConnectionError("socket closed while reading headers")
-            buf += chunk
-        head, rest = buf.split(b"\r\n\r\n", 1)
+        assert self.rfile is not None and self._reader is not None
+        # The buffered reader coalesces recv()s in C; the whole frame shares one
+        # deadline enforced by the polled raw reader underneath.
+        self._reader.deadline = time.monotonic() + self.timeout_s
         length = None
-        for line in head.decode("ascii", errors="replace").split("\r\n"):
-            if line.lower().startswith("content-length:"):
-                length = int(line.split(":", 1)[1].strip())
+        while True:
+            line = self.rfile.readline(65536)
+            if not line:
+                raise ConnectionError("socket closed while reading headers")
+            if line in (b"\r\n", b"\n"):
                 break
+            if line[:15].lower() == b"content-length:":
+                length = int(line[15:].strip())
         if length is None:
             raise ValueError("missing content-length header")
-        while len(rest) < length:
-            if time.time() > deadline:
-                raise TimeoutError("timed out reading JSON-RPC payload")
-            chunk = self.sock.recv(4096)
-            if not chunk:
-                raise ConnectionError("socket closed while reading payload")
-            rest += chunk
-        payload = rest[:length]
-        return json.loads(payload.decode("utf-8", errors="replace"))
+        payload = self.rfile.read(length)
+        if len(payload) < length:
+            raise ConnectionError("socket closed while reading payload")
+        try:
+            return json_loads(payload)
+        except ValueError:
+            return json.loads(payload.decode("utf-8", errors="replace"))
 
     def request(self, req_id: int, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         req = {"jsonrpc": "2.0", "id": req_id, "method": method}
@@ -268,20 +526,64 @@ class JSONRPCSocketClient:
             raise RuntimeError(f"rpc error for {method}: {resp['error']}")
         return resp
 
+    def request_encoded(self, method: str, payload: bytes) -> Dict[str, Any]:
+        """Send a request whose JSON body was encoded ahead of time."""
+        self._send_payload(payload)
+        resp = self._recv_obj()
+        if "error" in resp and resp["error"] is not None:
+            raise RuntimeError(f"rpc error for {method}: {resp['error']}")
+        return resp
 
-def rpc_hello(sock_path: pathlib.Path, timeout_s: float) -> Dict[str, Any]:
-    with JSONRPCSocketClient(sock_path, timeout_s=timeout_s) as cli:
-        return cli.request(1001, "turbodraft.hello", params={"client": "bench_ram_suite", "protocolVersion": 1}).get("result", {})
+    def batch(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """Pipeline several requests on this connection; responses in call order."""
+        reqs: List[Dict[str, Any]] = []
+        for method, params in calls:
+            self._next_id += 1
+            req: Dict[str, Any] = {"jsonrpc": "2.0", "id": self._next_id, "method": method}
+            if params is not None:
+                req["params"] = params
+            reqs.append(req)
+        # The server answers one connection's frames in order, so every request
+        # can be written before the first reply is read.
+        for req in reqs:
+            self._send_obj(req)
+        by_id: Dict[Any, Dict[str, Any]] = {}
+        while len(by_id) < len(reqs):
+            resp = self._recv_obj()
+            by_id[resp.get("id")] = resp
+        out: List[Dict[str, Any]] = []
+        for req in reqs:
+            resp = by_id.get(req["id"])
+            if resp is None:
+                raise ValueError(f"missing response for {req['method']}")
+            if "error" in resp and resp["error"] is not None:
+                raise RuntimeError(f"rpc error for {req['method']}: {resp['error']}")
+            out.append(resp)
+        return out
 
 
-def rpc_save(sock_path: pathlib.Path, session_id: str, content: str, timeout_s: float) -> Dict[str, Any]:
-    with JSONRPCSocketClient(sock_path, timeout_s=timeout_s) as cli:
-        return cli.request(1101, "turbodraft.session.save", params={"sessionId": session_id, "content": content}).get("result", {})
+# hello is sent at least once per cycle with the same id and params; encode it once.
+_HELLO_PAYLOAD = json_compact({
+    "jsonrpc": "2.0",
+    "id": 1001,
+    "method": "turbodraft.hello",
+    "params": {"client": "bench_ram_suite", "protocolVersion": 1},
+})
 
 
-def rpc_bench_metrics(sock_path: pathlib.Path, session_id: str, timeout_s: float) -> Dict[str, Any]:
+def rpc_hello(sock_path: pathlib.Path, timeout_s: float) -> Dict[str, Any]:
     with JSONRPCSocketClient(sock_path, timeout_s=timeout_s) as cli:
-        return cli.request(1201, "turbodraft.bench.metrics", params={"sessionId": session_id}).get("result", {})
+        return cli.request_encoded("turbodraft.hello", _HELLO_PAYLOAD).get("result", {})
+
+
+def rpc_save_and_metrics(
+    cli: JSONRPCSocketClient, session_id: str, content: str
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    save, metrics = cli.batch([
+        ("turbodraft.session.save", {"sessionId": session_id, "content": content}),
+        ("turbodraft.bench.metrics", {"sessionId": session_id}),
+    ])
+    return save.get("result", {}), metrics.get("result", {})
 
 
 def rpc_session_close(sock_path: pathlib.Path, session_id: str, timeout_s: float) -> float:
@@ -294,10 +596,23 @@ def rpc_session_close(sock_path: pathlib.Path, session_id: str, timeout_s: float
 # ---------- cleanup/preconditions ----------
 
 def kill_turbodraft(socket_path: pathlib.Path, app_bin: pathlib.Path) -> None:
-    _ = shell_ok("pkill -9 -f turbodraft-app || true", timeout_s=3.0)
-    _ = shell_ok(f"rm -f {shlex.quote(str(socket_path))}", timeout_s=3.0)
+    # Exec pkill directly; a login shell would source the user's rc files on
+    # every cycle just to run one command.
+    try:
+        subprocess.run(
+            [shutil.which("pkill") or "/usr/bin/pkill", "-9", "-f", "turbodraft-app"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=3.0,
+        )
+    except Exception:
+        pass
+    try:
+        socket_path.unlink(missing_ok=True)
+    except Exception:
+        pass
     if app_bin.exists() and app_bin.is_file():
-        _ = shell_ok("sleep 0.05", timeout_s=1.0)
+        time.sleep(0.05)
 
 
 def ensure_bootstrap(
@@ -322,7 +637,8 @@ def ensure_bootstrap(
             telemetry_path,
             telemetry_offset,
             timeout_s=min(2.0, timeout_s),
-            predicate=lambda o: o.get("event") == "cli_open",
+            predicate=is_cli_open,
+            prefilter=b'"cli_open"',
         )
         sid = evt.get("sessionId")
         if isinstance(sid, str) and sid:
@@ -333,6 +649,96 @@ def ensure_bootstrap(
 
 # ---------- cycles ----------
 
+class SpawnedCli:
+    """A CLI child launched with posix_spawn: stdout to /dev/null, stderr on a pipe.
+
+    A reader thread drains stderr as it arrives and keeps only the trailing
+    bytes, so a chatty child never blocks on a full pipe.
+    """
+
+    STDERR_TAIL_BYTES = 4096
+
+    def __init__(self, argv: List[str]):
+        self.args = argv
+        self.returncode: Optional[int] = None
+        # posix_spawn skips forking the interpreter. The read end is close-on-exec
+        # (os.pipe default), so only the write end reaches the child as fd 2.
+        r, w = os.pipe()
+        try:
+            self.pid = os.posix_spawn(
+                argv[0],
+                argv,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_DUP2, w, 2),
+                ],
+            )
+        except BaseException:
+            os.close(r)
+            raise
+        finally:
+            os.close(w)
+        self._stderr_chunks: Deque[bytes] = collections.deque()
+        self._stderr_bytes = 0
+        self._stderr_reader = threading.Thread(
+            target=self._drain_stderr, args=(r,), name="cli-stderr", daemon=True
+        )
+        self._stderr_reader.start()
+
+    def _drain_stderr(self, fd: int) -> None:
+        try:
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    return
+                # Keep whole chunks and evict from the left once the rest still
+                # covers the tail; no buffer is shifted or recopied per read.
+                self._stderr_chunks.append(chunk)
+                self._stderr_bytes += len(chunk)
+                while self._stderr_bytes - len(self._stderr_chunks[0]) >= self.STDERR_TAIL_BYTES:
+                    self._stderr_bytes -= len(self._stderr_chunks.popleft())
+        except OSError:
+            return
+        finally:
+            os.close(fd)
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                return self.returncode
+            if pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: float) -> int:
+        deadline = time.monotonic() + timeout
+        delay = 0.001
+        while self.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.02)
+        assert self.returncode is not None
+        return self.returncode
+
+    def kill(self) -> None:
+        try:
+            os.kill(self.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def stderr_tail(self, timeout_s: float = 0.1) -> str:
+        # The pipe normally hits EOF right after exit; don't hang on a grandchild
+        # that inherited it.
+        self._stderr_reader.join(timeout_s)
+        tail = b"".join(tuple(self._stderr_chunks))[-self.STDERR_TAIL_BYTES:]
+        return tail.decode("utf-8", errors="replace")
+
+
 @dataclass
 class CycleAttemptResult:
     success: bool
@@ -357,6 +763,7 @@ def run_cycle_attempt(
     save_iterations: int,
     payload_bytes: int,
     inject_fail: bool,
+    background_sampler: bool = False,
 ) -> CycleAttemptResult:
     cycle: Dict[str, Any] = {
         "cycle": cycle_idx,
@@ -374,7 +781,7 @@ def run_cycle_attempt(
 
     telemetry_offset = telemetry_path.stat().st_size if telemetry_path.exists() else 0
     session_id: Optional[str] = None
-    proc: Optional[subprocess.Popen[str]] = None
+    proc: Optional[SpawnedCli] = None
 
     def best_effort_attempt_cleanup() -> None:
         nonlocal session_id, proc
@@ -414,8 +821,10 @@ def run_cycle_attempt(
         if not idle_samples:
             raise RuntimeError("idle_sampling_empty")
 
-        idle_bytes = int(statistics.median(idle_samples))
-        peak_bytes = max(idle_samples)
+        # One sort yields both the idle median and the running peak seed.
+        idle_sorted = sorted(idle_samples)
+        idle_bytes = int(median_sorted(idle_sorted))
+        peak_bytes = idle_sorted[-1]
 
         cmd = [
             str(open_cli_bin),
@@ -426,14 +835,15 @@ def run_cycle_attempt(
             "--timeout-ms",
             str(int(max(1000, (open_timeout_s + close_timeout_s + 2.0) * 1000))),
         ]
-        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        proc = SpawnedCli(cmd)
         cycle["timestamps"]["trigger_ns"] = time.perf_counter_ns()
 
         open_evt, telemetry_offset = wait_for_new_jsonl(
             telemetry_path,
             telemetry_offset,
             timeout_s=open_timeout_s,
-            predicate=lambda o: o.get("event") == "cli_open",
+            predicate=is_cli_open,
+            prefilter=b'"cli_open"',
         )
         cycle["timestamps"]["open_event_ns"] = time.perf_counter_ns()
         session_id = str(open_evt.get("sessionId") or "")
@@ -442,6 +852,12 @@ def run_cycle_attempt(
         cycle["sessionId"] = session_id
 
         base_text = fixture_path.read_text(encoding="utf-8")
+        # Build every save body up front so the workload window only carries RPCs
+        # and sampling, not payload string assembly.
+        contents = tuple(
+            base_text + deterministic_payload(cycle_idx, i, payload_bytes)
+            for i in range(max(1, save_iterations))
+        )
         diag_cov = {"history": 0, "styler": 0}
         hist_count_peak = None
         hist_bytes_peak = None
@@ -449,35 +865,43 @@ def run_cycle_attempt(
         styler_limit = None
 
         cycle["timestamps"]["workload_start_ns"] = time.perf_counter_ns()
-        for i in range(max(1, save_iterations)):
-            content = base_text + deterministic_payload(cycle_idx, i, payload_bytes)
-            _ = rpc_save(socket_path, session_id, content, timeout_s=max(1.0, open_timeout_s))
-            metrics = rpc_bench_metrics(socket_path, session_id, timeout_s=max(1.0, open_timeout_s))
-
-            if isinstance(metrics.get("memoryResidentBytes"), (int, float)):
-                peak_bytes = max(peak_bytes, int(metrics["memoryResidentBytes"]))
-
-            h_count = metrics.get("historySnapshotCount")
-            h_bytes = metrics.get("historySnapshotBytes")
-            c_count = metrics.get("stylerCacheEntryCount")
-            c_limit = metrics.get("stylerCacheLimit")
-            if isinstance(h_count, int):
-                diag_cov["history"] += 1
-                hist_count_peak = max(hist_count_peak or h_count, h_count)
-            if isinstance(h_bytes, (int, float)):
-                hist_bytes = int(h_bytes)
-                hist_bytes_peak = max(hist_bytes_peak or hist_bytes, hist_bytes)
-            if isinstance(c_count, int):
-                diag_cov["styler"] += 1
-                styler_entry_peak = max(styler_entry_peak or c_count, c_count)
-            if isinstance(c_limit, int):
-                styler_limit = c_limit
-
-            r = rss_bytes(server_pid)
-            if r is not None:
-                peak_bytes = max(peak_bytes, r)
-
-            time.sleep(max(0.0, sample_ms / 1000.0))
+        # peakResidentBytes keeps its per-save readings so gates stay comparable
+        # with older runs; the optional background sampler reports separately.
+        sampler = RssPeakSampler(server_pid, sample_ms) if background_sampler else None
+        if sampler is not None:
+            sampler.start()
+        try:
+            # One connection carries every save/metrics pair of the workload.
+            with JSONRPCSocketClient(socket_path, timeout_s=max(1.0, open_timeout_s)) as rpc:
+                for content in contents:
+                    _, metrics = rpc_save_and_metrics(rpc, session_id, content)
+
+                    if isinstance(metrics.get("memoryResidentBytes"), (int, float)):
+                        peak_bytes = max(peak_bytes, int(metrics["memoryResidentBytes"]))
+
+                    h_count = metrics.get("historySnapshotCount")
+                    h_bytes = metrics.get("historySnapshotBytes")
+                    c_count = metrics.get("stylerCacheEntryCount")
+                    c_limit = metrics.get("stylerCacheLimit")
+                    if isinstance(h_count, int):
+                        diag_cov["history"] += 1
+                        hist_count_peak = max(hist_count_peak or h_count, h_count)
+                    if isinstance(h_bytes, (int, float)):
+                        hist_bytes = int(h_bytes)
+                        hist_bytes_peak = max(hist_bytes_peak or hist_bytes, hist_bytes)
+                    if isinstance(c_count, int):
+                        diag_cov["styler"] += 1
+                        styler_entry_peak = max(styler_entry_peak or c_count, c_count)
+                    if isinstance(c_limit, int):
+                        styler_limit = c_limit
+
+                    r = rss_bytes(server_pid)
+                    if r is not None:
+                        peak_bytes = max(peak_bytes, r)
+
+                    time.sleep(max(0.0, sample_ms / 1000.0))
+        finally:
+            sampled_peak = sampler.stop() if sampler is not None else None
         cycle["timestamps"]["workload_end_ns"] = time.perf_counter_ns()
 
         close_trigger_ns = time.perf_counter_ns()
@@ -492,7 +916,8 @@ def run_cycle_attempt(
             telemetry_path,
             telemetry_offset,
             timeout_s=close_timeout_s,
-            predicate=lambda o: o.get("event") == "cli_wait",
+            predicate=is_cli_wait,
+            prefilter=b'"cli_wait"',
         )
         cycle["timestamps"]["wait_event_ns"] = time.perf_counter_ns()
 
@@ -503,10 +928,12 @@ def run_cycle_attempt(
         )
         if not post_samples:
             raise RuntimeError("post_close_sampling_empty")
-        post_close_bytes = int(statistics.median(post_samples))
+        post_close_bytes = int(median_sorted(sorted(post_samples)))
 
         cycle["idleResidentBytes"] = idle_bytes
         cycle["peakResidentBytes"] = int(peak_bytes)
+        if sampler is not None:
+            cycle["sampledPeakResidentBytes"] = sampled_peak
         cycle["postCloseResidentBytes"] = post_close_bytes
         cycle["peakDeltaBytes"] = int(peak_bytes - idle_bytes)
         cycle["residualBytes"] = int(post_close_bytes - idle_bytes)
@@ -543,7 +970,7 @@ def run_cycle_attempt(
         cycle["validation"]["ordering_errors"] = ord_errs
         cycle["validation"]["ordering_ok"] = len(ord_errs) == 0
 
-        stderr = (proc.stderr.read() if proc.stderr else "").strip()
+        stderr = proc.stderr_tail().strip()
         cycle["returnCode"] = int(proc.returncode)
         if stderr:
             cycle["stderrTail"] = stderr[-300:]
@@ -561,10 +988,6 @@ def run_cycle_attempt(
         return CycleAttemptResult(True, True, "ok", cycle)
 
     except subprocess.TimeoutExpired as ex:
-        try:
-            proc = ex.__dict__.get("process")
-        except Exception:
-            pass
         best_effort_attempt_cleanup()
         cycle["ok"] = False
         cycle["error"] = f"timeout:{ex}"
@@ -615,6 +1038,12 @@ def main() -> int:
     ap.add_argument("--idle-settle-ms", type=float, default=180.0)
     ap.add_argument("--post-close-settle-ms", type=float, default=220.0)
     ap.add_argument("--sample-ms", type=float, default=20.0)
+    ap.add_argument(
+        "--background-sampler",
+        action="store_true",
+        default=False,
+        help="Also sample RSS every --sample-ms on a background thread during the workload; reported as sampledPeakResidentBytes",
+    )
     ap.add_argument("--save-iterations", type=int, default=8)
     ap.add_argument("--payload-bytes", type=int, default=32_000)
     ap.add_argument("--clean-slate", action="store_true", default=False)
@@ -648,9 +1077,9 @@ def main() -> int:
     open_cli_bin = repo / ".build" / "release" / "turbodraft-bench"
     app_bin = repo / ".build" / "release" / "turbodraft-app"
     if not open_cli_bin.exists():
-        ok, text = shell_ok("command -v turbodraft-bench", timeout_s=2.0)
-        if ok:
-            open_cli_bin = pathlib.Path(text.splitlines()[-1].strip())
+        found = shutil.which("turbodraft-bench")
+        if found:
+            open_cli_bin = pathlib.Path(found)
     if not open_cli_bin.exists():
         raise SystemExit("turbodraft-bench binary not found (build release first)")
 
@@ -669,6 +1098,9 @@ def main() -> int:
     unrecovered_failures = 0
     transient_failure_injected = False
     transient_failure_recovered = False
+    # The inter-cycle delay is a deadline, not a fixed sleep: clean-slate
+    # teardown and bootstrap for the next cycle count toward it.
+    resume_at = 0.0
 
     for cycle_idx in range(1, max(1, args.cycles) + 1):
         cycle_ok = False
@@ -690,6 +1122,10 @@ def main() -> int:
                     timeout_s=max(2.0, args.open_timeout_s),
                 )
 
+            slack = resume_at - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+
             result = run_cycle_attempt(
                 cycle_idx,
                 attempt_idx,
@@ -705,6 +1141,7 @@ def main() -> int:
                 save_iterations=args.save_iterations,
                 payload_bytes=args.payload_bytes,
                 inject_fail=inject_fail,
+                background_sampler=args.background_sampler,
             )
 
             last_reason = result.reason
@@ -724,89 +1161,84 @@ def main() -> int:
         cycles.append(last_cycle)
 
         if cycle_idx < args.cycles:
-            time.sleep(max(0.0, args.inter_cycle_delay_s))
+            resume_at = time.monotonic() + max(0.0, args.inter_cycle_delay_s)
 
     cycles_path = out_dir / "cycles.jsonl"
-    with cycles_path.open("w", encoding="utf-8") as fh:
-        for c in cycles:
-            fh.write(json.dumps(c, separators=(",", ":")) + "\n")
+    # Serialize every line first and hand the file a single buffer to write.
+    cycles_path.write_bytes(b"".join(jsonl_line(c) for c in cycles))
 
     steady = [c for c in cycles if c.get("ok") and not c.get("warmup")]
 
-    def collect(metric: str, convert_mib: bool = True) -> List[float]:
-        out: List[float] = []
-        for c in steady:
-            v = c.get(metric)
+    # Materialize each metric once as (cycle, MiB) columns in a single pass over
+    # `steady`; the summaries, slope, outlier and no-outlier views all reuse them.
+    # The same pass counts optional-probe coverage and timestamp ordering.
+    mib = 1024.0 * 1024.0
+    columns: Dict[str, List[Tuple[int, float]]] = {
+        key: []
+        for key in (
+            "idleResidentBytes",
+            "peakResidentBytes",
+            "sampledPeakResidentBytes",
+            "postCloseResidentBytes",
+            "peakDeltaBytes",
+            "residualBytes",
+        )
+    }
+    coverage_counts = dict.fromkeys(
+        ("historySnapshotCountPeak", "historySnapshotBytesPeak", "stylerCacheEntryPeak", "stylerCacheLimit"),
+        0,
+    )
+    ordering_ok = True
+    for c in steady:
+        cycle_no = int(c["cycle"])
+        for key, col in columns.items():
+            v = c.get(key)
             if isinstance(v, (int, float)):
-                out.append(float(v) / (1024.0 * 1024.0) if convert_mib else float(v))
-        return out
-
-    idle_mib = collect("idleResidentBytes")
-    peak_mib = collect("peakResidentBytes")
-    post_close_mib = collect("postCloseResidentBytes")
-    peak_delta_mib = collect("peakDeltaBytes")
-    residual_mib = collect("residualBytes")
-
-    slope = linear_slope_per_cycle([
-        (int(c["cycle"]), float(c["peakDeltaBytes"]) / (1024.0 * 1024.0))
-        for c in steady
-        if isinstance(c.get("peakDeltaBytes"), (int, float))
-    ])
+                col.append((cycle_no, float(v) / mib))
+        for key in coverage_counts:
+            if c.get(key) is not None:
+                coverage_counts[key] += 1
+        if not c.get("validation", {}).get("ordering_ok", False):
+            ordering_ok = False
+
+    peak_delta_col = columns["peakDeltaBytes"]
+    residual_col = columns["residualBytes"]
+    # Both gated metrics feed summarize and the IQR quartiles; sort each once.
+    peak_delta_sorted = sorted(v for _, v in peak_delta_col)
+    residual_sorted = sorted(v for _, v in residual_col)
+    slope = linear_slope_per_cycle(peak_delta_col)
 
     summary = {
-        "idleResidentMiB": summarize(idle_mib),
-        "peakResidentMiB": summarize(peak_mib),
-        "postCloseResidentMiB": summarize(post_close_mib),
-        "peakDeltaResidentMiB": summarize(peak_delta_mib),
-        "postCloseResidualMiB": summarize(residual_mib),
+        "idleResidentMiB": summarize([v for _, v in columns["idleResidentBytes"]]),
+        "peakResidentMiB": summarize([v for _, v in columns["peakResidentBytes"]]),
+        "postCloseResidentMiB": summarize([v for _, v in columns["postCloseResidentBytes"]]),
+        "peakDeltaResidentMiB": summarize(peak_delta_sorted, sorted_vals=peak_delta_sorted),
+        "postCloseResidualMiB": summarize(residual_sorted, sorted_vals=residual_sorted),
         "memorySlopeMiBPerCycle": slope,
     }
+    if args.background_sampler:
+        summary["sampledPeakResidentMiB"] = summarize([v for _, v in columns["sampledPeakResidentBytes"]])
 
     outliers = {
-        "peakDeltaResidentMiB": detect_outliers_iqr([
-            (int(c["cycle"]), float(c["peakDeltaBytes"]) / (1024.0 * 1024.0))
-            for c in steady
-            if isinstance(c.get("peakDeltaBytes"), (int, float))
-        ]),
-        "postCloseResidualMiB": detect_outliers_iqr([
-            (int(c["cycle"]), float(c["residualBytes"]) / (1024.0 * 1024.0))
-            for c in steady
-            if isinstance(c.get("residualBytes"), (int, float))
-        ]),
+        "peakDeltaResidentMiB": detect_outliers_iqr(peak_delta_col, sorted_vals=peak_delta_sorted),
+        "postCloseResidualMiB": detect_outliers_iqr(residual_col, sorted_vals=residual_sorted),
     }
 
     peak_outlier_cycles = set(int(x) for x in outliers["peakDeltaResidentMiB"].get("cycles", []))
     residual_outlier_cycles = set(int(x) for x in outliers["postCloseResidualMiB"].get("cycles", []))
 
-    peak_delta_no_outlier: List[float] = [
-        float(c["peakDeltaBytes"]) / (1024.0 * 1024.0)
-        for c in steady
-        if isinstance(c.get("peakDeltaBytes"), (int, float)) and int(c["cycle"]) not in peak_outlier_cycles
-    ]
-    residual_no_outlier: List[float] = [
-        float(c["residualBytes"]) / (1024.0 * 1024.0)
-        for c in steady
-        if isinstance(c.get("residualBytes"), (int, float)) and int(c["cycle"]) not in residual_outlier_cycles
-    ]
+    peak_delta_no_outlier = [v for i, v in peak_delta_col if i not in peak_outlier_cycles]
+    residual_no_outlier = [v for i, v in residual_col if i not in residual_outlier_cycles]
     summary["peakDeltaResidentMiBNoOutliers"] = summarize(peak_delta_no_outlier)
     summary["postCloseResidualMiBNoOutliers"] = summarize(residual_no_outlier)
 
     # coverage for optional probes
-    def coverage_of(field: str) -> float:
-        if not steady:
-            return 0.0
-        have = sum(1 for c in steady if c.get(field) is not None)
-        return have / float(len(steady))
-
     optional_coverage = {
-        "historySnapshotCountPeak": coverage_of("historySnapshotCountPeak"),
-        "historySnapshotBytesPeak": coverage_of("historySnapshotBytesPeak"),
-        "stylerCacheEntryPeak": coverage_of("stylerCacheEntryPeak"),
-        "stylerCacheLimit": coverage_of("stylerCacheLimit"),
+        key: (have / float(len(steady)) if steady else 0.0)
+        for key, have in coverage_counts.items()
     }
 
     # core validity
-    ordering_ok = all(bool(c.get("validation", {}).get("ordering_ok", False)) for c in steady)
     sample_ok = (
         summary["peakDeltaResidentMiB"]["n"] == len(steady)
         and summary["postCloseResidualMiB"]["n"] == len(steady)
@@ -817,25 +1249,28 @@ def main() -> int:
     residual_p95_raw = summary["postCloseResidualMiB"].get("p95")
     peak_p95 = summary["peakDeltaResidentMiBNoOutliers"].get("p95") or peak_p95_raw
     residual_p95 = summary["postCloseResidualMiBNoOutliers"].get("p95") or residual_p95_raw
+    peak_limit = float(args.max_peak_delta_p95_mib)
+    residual_limit = float(args.max_post_close_residual_p95_mib)
+    slope_limit = float(args.max_memory_slope_mib_per_cycle)
     gate_checks = {
         "peak_delta_p95": {
-            "limit_mib": float(args.max_peak_delta_p95_mib),
+            "limit_mib": peak_limit,
             "value_mib": peak_p95,
             "raw_value_mib": peak_p95_raw,
             "source": "no_outlier_p95",
-            "pass": (peak_p95 is not None and peak_p95 <= float(args.max_peak_delta_p95_mib)),
+            "pass": (peak_p95 is not None and peak_p95 <= peak_limit),
         },
         "post_close_residual_p95": {
-            "limit_mib": float(args.max_post_close_residual_p95_mib),
+            "limit_mib": residual_limit,
             "value_mib": residual_p95,
             "raw_value_mib": residual_p95_raw,
             "source": "no_outlier_p95",
-            "pass": (residual_p95 is not None and residual_p95 <= float(args.max_post_close_residual_p95_mib)),
+            "pass": (residual_p95 is not None and residual_p95 <= residual_limit),
         },
         "slope_per_cycle": {
-            "limit_mib": float(args.max_memory_slope_mib_per_cycle),
+            "limit_mib": slope_limit,
             "value_mib": slope,
-            "pass": (slope is not None and slope <= float(args.max_memory_slope_mib_per_cycle)),
+            "pass": (slope is not None and slope <= slope_limit),
         },
     }
     gate_pass = all(v.get("pass", False) for v in gate_checks.values())
@@ -868,6 +1303,7 @@ def main() -> int:
             "idleSettleMs": args.idle_settle_ms,
             "postCloseSettleMs": args.post_close_settle_ms,
             "sampleMs": args.sample_ms,
+            "backgroundSampler": args.background_sampler,
             "saveIterations": args.save_iterations,
             "payloadBytes": args.payload_bytes,
             "cleanSlate": args.clean_slate,
@@ -915,7 +1351,9 @@ def main() -> int:
         comp_path = pathlib.Path(args.compare)
         if comp_path.exists():
             try:
-                prev = json.loads(comp_path.read_text(encoding="utf-8"))
+                # The previous report embeds every cycle; parse it from bytes with
+                # the fast decoder even though only the summary is compared.
+                prev = json_loads(comp_path.read_bytes())
                 prev_summary = prev.get("summarySteadyState", {})
                 report["compare"] = {
                     "path": str(comp_path),
@@ -932,7 +1370,7 @@ def main() -> int:
                 report["compare"] = {"path": str(comp_path), "error": str(ex)}
 
     report_path = out_dir / "report.json"
-    report_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    report_path.write_bytes(json_pretty(report))
 
     print(f"ram_report\t{report_path}")
     print(f"raw_cycles_jsonl\t{cycles_path}")
@@ -3,19 +3,19 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import hashlib
+import os
 import pathlib
 import subprocess
 import sys
 import time
+from typing import Dict, List, Optional, Sequence
 
 
-def apple_escape(text: str) -> str:
-    return text.replace("\\", "\\\\").replace('"', '\\"')
-
-
-def run_osascript(script: str, timeout_s: float = 12.0) -> subprocess.CompletedProcess[str]:
+def run_osascript(script: str, args: Sequence[str] = (), timeout_s: float = 12.0) -> subprocess.CompletedProcess[str]:
+    # `-` reads the program from stdin; trailing args become the script's argv.
     return subprocess.run(
-        ["osascript"],
+        ["osascript", "-", *args],
         input=script,
         text=True,
         capture_output=True,
@@ -23,6 +23,36 @@ def run_osascript(script: str, timeout_s: float = 12.0) -> subprocess.CompletedP
     )
 
 
+def compile_osascript(source: str, cache_dir: pathlib.Path, name: str) -> Optional[pathlib.Path]:
+    """Compile `source` to a cached .scpt keyed by its content.
+
+    Later runs hand osascript the compiled file and skip parsing/compiling the
+    source text. Returns None when osacompile is unavailable or fails.
+    """
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+    out = cache_dir / f"{name}-{digest}.scpt"
+    if out.exists():
+        return out
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    src = cache_dir / f"{name}-{digest}.{os.getpid()}.applescript"
+    tmp = cache_dir / f"{name}-{digest}.{os.getpid()}.scpt"
+    try:
+        src.write_text(source, encoding="utf-8")
+        cp = subprocess.run(["osacompile", "-o", str(tmp), str(src)], text=True, capture_output=True, timeout=12.0)
+        if cp.returncode != 0:
+            return None
+        os.replace(tmp, out)
+        return out
+    except (OSError, subprocess.SubprocessError):
+        return None
+    finally:
+        for leftover in (src, tmp):
+            try:
+                leftover.unlink()
+            except FileNotFoundError:
+                pass
+
+
 def capture_screenshot(path: pathlib.Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     subprocess.run(["screencapture", "-x", str(path)], check=False)
@@ -33,50 +63,85 @@ def write_artifact(path: pathlib.Path, text: str) -> None:
     path.write_text(text, encoding="utf-8")
 
 
-def drive_find_replace(query: str, replacement: str, timeout_s: float = 12.0) -> None:
-    script = f"""
-tell application "System Events"
-  set targetProc to missing value
-  set startedAt to (current date)
-  repeat while ((current date) - startedAt) < 8
-    if exists process "TurboDraft" then
-      set targetProc to process "TurboDraft"
-    else if exists process "turbodraft-app" then
-      set targetProc to process "turbodraft-app"
-    else if exists process "turbodraft-app.debug" then
-      set targetProc to process "turbodraft-app.debug"
-    else
-      set targetProc to missing value
-    end if
-    if targetProc is not missing value then
-      tell targetProc to set frontmost to true
-      exit repeat
-    end if
-    delay 0.02
-  end repeat
-  if targetProc is missing value then error "TurboDraft process not found"
-
-  delay 0.06
-  keystroke "f" using command down
-  delay 0.08
-  keystroke "{apple_escape(query)}"
-  delay 0.08
-  keystroke "f" using {{command down, option down}}
-  delay 0.08
-  keystroke "{apple_escape(replacement)}"
-  delay 0.10
-  tell targetProc
-    click button "Replace All" of window 1
+APP_PROCESS_NAMES = ("TurboDraft", "turbodraft-app", "turbodraft-app.debug")
+
+
+def find_app_pid() -> Optional[int]:
+    """One `ps` scan for the editor process, preferring names in APP_PROCESS_NAMES order."""
+    cp = subprocess.run(["ps", "-Ao", "pid=,comm="], text=True, capture_output=True)
+    found: Dict[str, int] = {}
+    for line in cp.stdout.splitlines():
+        pid_text, _, comm = line.strip().partition(" ")
+        name = os.path.basename(comm.strip())
+        if name in APP_PROCESS_NAMES and name not in found and pid_text.isdigit():
+            found[name] = int(pid_text)
+    for name in APP_PROCESS_NAMES:
+        if name in found:
+            return found[name]
+    return None
+
+
+def wait_for_app_pid(timeout_s: float = 8.0) -> int:
+    # Resolved once in Python so every AppleScript can address the process by
+    # unix id instead of re-walking the System Events process list.
+    deadline = time.monotonic() + timeout_s
+    while True:
+        pid = find_app_pid()
+        if pid is not None:
+            return pid
+        if time.monotonic() >= deadline:
+            raise RuntimeError("TurboDraft process not found")
+        time.sleep(0.02)
+
+
+FIND_REPLACE_SCRIPT = """
+on run argv
+  set findQuery to item 1 of argv
+  set replaceText to item 2 of argv
+  set appPid to (item 3 of argv) as integer
+  tell application "System Events"
+    set targetProc to first process whose unix id is appPid
+    tell targetProc to set frontmost to true
+
+    delay 0.06
+    keystroke "f" using command down
+    delay 0.08
+    keystroke findQuery
+    delay 0.08
+    keystroke "f" using {command down, option down}
+    delay 0.08
+    keystroke replaceText
+    delay 0.10
+    tell targetProc
+      click button "Replace All" of window 1
+    end tell
+    delay 0.12
+    key code 53 -- ESC closes find
+    delay 0.05
+    keystroke "s" using command down
+    keystroke "w" using command down
   end tell
-  delay 0.12
-  key code 53 -- ESC closes find
-  delay 0.05
-  keystroke "s" using command down
-  delay 0.05
-  keystroke "w" using command down
-end tell
+end run
 """
-    cp = run_osascript(script, timeout_s=timeout_s)
+
+
+def drive_find_replace(
+    query: str,
+    replacement: str,
+    pid: int,
+    compiled: Optional[pathlib.Path] = None,
+    timeout_s: float = 12.0,
+) -> None:
+    # Query and replacement travel as argv, so they never need AppleScript quoting.
+    if compiled is not None:
+        cp = subprocess.run(
+            ["osascript", str(compiled), query, replacement, str(pid)],
+            text=True,
+            capture_output=True,
+            timeout=timeout_s,
+        )
+    else:
+        cp = run_osascript(FIND_REPLACE_SCRIPT, args=(query, replacement, str(pid)), timeout_s=timeout_s)
     if cp.returncode != 0:
         detail = cp.stderr.strip() or cp.stdout.strip() or "osascript failed"
         if "Not authorized to send Apple events" in detail:
@@ -93,6 +158,7 @@ def main() -> int:
     ap.add_argument("--timeout-s", type=float, default=14.0)
     ap.add_argument("--artifacts-dir", default=None, help="Write screenshots/logs here")
     ap.add_argument("--keep-fixture", action="store_true", help="Keep generated fixture file")
+    ap.add_argument("--shots", action="store_true", help="Capture before/after screenshots on passing runs too")
     args = ap.parse_args()
 
     repo = pathlib.Path(args.repo_root).resolve()
@@ -104,6 +170,7 @@ def main() -> int:
     artifacts = pathlib.Path(args.artifacts_dir).resolve() if args.artifacts_dir else (repo / "tmp" / "ui-e2e-artifacts" / timestamp)
     pre_shot = artifacts / "before.png"
     post_shot = artifacts / "after.png"
+    fail_shot = artifacts / "failure.png"
     err_log = artifacts / "error.log"
     result_dump = artifacts / "fixture.txt"
 
@@ -111,11 +178,23 @@ def main() -> int:
     if not turbodraft_bin.exists():
         raise SystemExit(f"missing binary: {turbodraft_bin}")
 
+    compiled = compile_osascript(FIND_REPLACE_SCRIPT, repo / "tmp" / "osa-cache", "find-replace")
+
     proc = subprocess.Popen([str(turbodraft_bin), str(fixture)], cwd=str(repo))
     try:
         time.sleep(0.25)
-        capture_screenshot(pre_shot)
-        drive_find_replace(query=args.query, replacement=args.replacement, timeout_s=args.timeout_s)
+        if args.shots:
+            capture_screenshot(pre_shot)
+        pid = wait_for_app_pid()
+        drive_find_replace(
+            query=args.query,
+            replacement=args.replacement,
+            pid=pid,
+            compiled=compiled,
+            timeout_s=args.timeout_s,
+        )
+        # Always shoot the editor before it closes: a timeout below or a fixture
+        # mismatch afterwards needs this state. Passing runs drop it unless --shots.
         capture_screenshot(post_shot)
         try:
             proc.wait(timeout=max(2.0, args.timeout_s))
@@ -129,6 +208,12 @@ def main() -> int:
             write_artifact(result_dump, fixture.read_text(encoding="utf-8"))
         except Exception:
             pass
+        if not post_shot.exists():
+            # The UI sequence itself failed; shoot whatever is on screen now.
+            try:
+                capture_screenshot(fail_shot)
+            except OSError:
+                pass
         print("ui_find_replace_e2e\tFAIL", file=sys.stderr)
         print(str(exc), file=sys.stderr)
         print(f"artifacts\t{artifacts}", file=sys.stderr)
@@ -152,6 +237,11 @@ def main() -> int:
         print(f"artifacts\t{artifacts}", file=sys.stderr)
         return 1
 
+    if not args.shots:
+        try:
+            post_shot.unlink()
+        except FileNotFoundError:
+            pass
     print("ui_find_replace_e2e\tPASS")
     print(f"fixture\t{fixture}")
     if not args.keep_fixture:
@@ -2,102 +2,308 @@
 from __future__ import annotations
 
 import argparse
+import os
 import pathlib
+import selectors
 import subprocess
 import sys
 import time
+from typing import Callable, Dict, List, Optional, Tuple
 
+try:
+    import AppKit  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    AppKit = None
 
-def run_osascript(script: str, timeout_s: float = 12.0) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        ["osascript"],
-        input=script,
-        text=True,
-        capture_output=True,
-        timeout=timeout_s,
-    )
-
-
-def set_frontmost(timeout_s: float = 10.0) -> None:
-    script = """
-tell application "System Events"
-  set targetProc to missing value
-  set startedAt to (current date)
-  repeat while ((current date) - startedAt) < 8
-    if exists process "TurboDraft" then
-      set targetProc to process "TurboDraft"
-    else if exists process "turbodraft-app" then
-      set targetProc to process "turbodraft-app"
-    else if exists process "turbodraft-app.debug" then
-      set targetProc to process "turbodraft-app.debug"
-    else
-      set targetProc to missing value
-    end if
-    if targetProc is not missing value then
-      tell targetProc to set frontmost to true
-      exit repeat
-    end if
-    delay 0.02
-  end repeat
-  if targetProc is missing value then error "TurboDraft process not found"
-end tell
-"""
-    cp = run_osascript(script, timeout_s=timeout_s)
-    if cp.returncode != 0:
-        raise RuntimeError(cp.stderr.strip() or cp.stdout.strip() or "could not focus TurboDraft")
 
+def apple_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"')
 
-def send_key(ch: str, modifiers: str = "", timeout_s: float = 8.0) -> None:
-    if modifiers:
-        script = f'tell application "System Events" to keystroke "{ch}" using {{{modifiers}}}'
-    else:
-        script = f'tell application "System Events" to keystroke "{ch}"'
-    cp = run_osascript(script, timeout_s=timeout_s)
+
+def run_osascript(script: str, timeout_s: float = 12.0) -> Tuple[bool, str]:
+    try:
+        cp = subprocess.run(["osascript"], input=script, text=True, capture_output=True, timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        return (False, "osascript timed out")
     if cp.returncode != 0:
-        raise RuntimeError(cp.stderr.strip() or cp.stdout.strip() or f"failed keystroke {ch}")
+        return (False, cp.stderr.strip() or cp.stdout.strip())
+    return (True, cp.stdout.strip())
+
+
+class OSAScriptServer:
+    """Long-lived `osascript -i` co-process, with one-shot osascript as fallback.
+
+    Interactive mode reads one line at a time, so each script is wrapped in a
+    single-line `run script "..."` and followed by a sentinel expression whose
+    echo marks the end of the output. A wrapped script reports success as a
+    single `=> "<ok mark>"` result; anything else (a compile error printed by
+    `run script`, a missing `=>` prefix, a changed echo format) is a failure.
+
+    The interactive output format is not documented, so a handshake checks it
+    before the first real script. If the handshake fails, the server disables
+    itself and every script runs through `run_osascript`. Once a real script
+    has been written, a timeout or exit fails that step: the script may already
+    have sent keystrokes, and running it again would repeat them.
+    """
+
+    _ERR_MARK = "__turbodraft_osa_error__"
+    _OK_MARK = "__turbodraft_osa_ok__"
+    _HANDSHAKE_TIMEOUT_S = 3.0
+
+    def __init__(self) -> None:
+        self.proc: Optional[subprocess.Popen[bytes]] = None
+        self._sel: Optional[selectors.BaseSelector] = None
+        self._seq = 0
+        self._buf = bytearray()
+        self.disabled = False
+
+    def close(self) -> None:
+        if self.proc is not None:
+            try:
+                self.proc.kill()
+                self.proc.wait(timeout=1.0)
+            except Exception:
+                pass
+            self.proc = None
+        if self._sel is not None:
+            self._sel.close()
+            self._sel = None
+        self._buf = bytearray()
+
+    def _disable(self) -> None:
+        self.close()
+        self.disabled = True
+
+    def _start(self) -> bool:
+        try:
+            self.proc = subprocess.Popen(
+                ["osascript", "-i"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        except OSError:
+            return False
+        assert self.proc.stdout is not None
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.proc.stdout.fileno(), selectors.EVENT_READ)
+        self._buf = bytearray()
+        ok, _ = self._eval("delay 0", timeout_s=self._HANDSHAKE_TIMEOUT_S)
+        return ok
+
+    def _eval(self, script: str, timeout_s: float) -> Tuple[bool, Optional[str]]:
+        """Returns (True, None) on success, (False, message) when the script failed,
+        and (False, None) when the co-process itself broke down."""
+        proc = self.proc
+        sel = self._sel
+        assert proc is not None and proc.stdin is not None and proc.stdout is not None and sel is not None
+        self._seq += 1
+        sentinel = f"__turbodraft_osa_done_{self._seq}__".encode("ascii")
+        wrapped = (
+            f"try\n{script.strip()}\non error errMsg\n"
+            f'return "{self._ERR_MARK}" & errMsg\nend try\nreturn "{self._OK_MARK}"'
+        )
+        line = 'run script "' + apple_escape(wrapped).replace("\n", "\\n") + '"\n'
+        try:
+            proc.stdin.write(line.encode("utf-8") + b'"' + sentinel + b'"\n')
+            proc.stdin.flush()
+        except OSError:
+            return (False, None)
+
+        fd = proc.stdout.fileno()
+        deadline = time.monotonic() + timeout_s
+        scan = 0
+        while True:
+            end = self._buf.find(sentinel, scan)
+            if end >= 0:
+                break
+            scan = max(0, len(self._buf) - len(sentinel) + 1)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return (False, None)
+            if not sel.select(remaining):
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return (False, None)
+            self._buf += chunk
+
+        head = bytes(self._buf[:end])
+        nl = self._buf.find(b"\n", end + len(sentinel))
+        del self._buf[: nl + 1 if nl >= 0 else len(self._buf)]
+        # Drop the partial sentinel line (prompt/result prefix) from the head.
+        head = head[: head.rfind(b"\n") + 1]
+        results: List[str] = []
+        stray: List[str] = []
+        for raw in head.decode("utf-8", errors="replace").splitlines():
+            text = raw.strip()
+            while text.startswith(("?>", ">>")):
+                text = text[2:].strip()
+            if not text:
+                continue
+            if not text.startswith("=>"):
+                stray.append(text)
+                continue
+            text = text[2:].strip()
+            if len(text) >= 2 and text[0] == text[-1] == '"':
+                text = text[1:-1]
+            results.append(text)
+        if stray:
+            # Printed by `run script` itself, e.g. a compile error that never
+            # reached the try block inside the wrapped source.
+            return (False, "\n".join(stray))
+        if results == [self._OK_MARK]:
+            return (True, None)
+        if len(results) == 1 and results[0].startswith(self._ERR_MARK):
+            return (False, results[0][len(self._ERR_MARK):].strip() or "osascript failed")
+        return (False, None)
+
+    def run(self, script: str, timeout_s: float = 8.0) -> Tuple[bool, str]:
+        if not self.disabled and self.proc is None and not self._start():
+            self._disable()
+        if not self.disabled:
+            ok, message = self._eval(script, timeout_s)
+            if ok:
+                return (True, "")
+            # The script may already have sent keystrokes, so a broken co-process
+            # fails the step instead of replaying it through plain osascript.
+            return (False, message or "osascript co-process stopped responding")
+        return run_osascript(script, timeout_s=timeout_s)
+
+
+_OSA_SERVER = OSAScriptServer()
+
+
+APP_PROCESS_NAMES = ("TurboDraft", "turbodraft-app", "turbodraft-app.debug")
+
+
+def find_app_pid() -> Optional[int]:
+    cp = subprocess.run(["ps", "-Ao", "pid=,comm="], text=True, capture_output=True)
+    found: Dict[str, int] = {}
+    for line in cp.stdout.splitlines():
+        pid_text, _, comm = line.strip().partition(" ")
+        name = os.path.basename(comm.strip())
+        if name in APP_PROCESS_NAMES and name not in found and pid_text.isdigit():
+            found[name] = int(pid_text)
+    for name in APP_PROCESS_NAMES:
+        if name in found:
+            return found[name]
+    return None
+
+
+def wait_for_app_pid(timeout_s: float = 8.0) -> int:
+    # Scripts below address the process by this PID; no System Events scan.
+    deadline = time.monotonic() + timeout_s
+    while True:
+        pid = find_app_pid()
+        if pid is not None:
+            return pid
+        if time.monotonic() >= deadline:
+            raise RuntimeError("TurboDraft process not found")
+        time.sleep(0.02)
+
+
+def set_frontmost(pid: int, timeout_s: float = 10.0) -> None:
+    script = f'tell application "System Events" to set frontmost of (first process whose unix id is {pid}) to true'
+    ok, out = _OSA_SERVER.run(script, timeout_s=timeout_s)
+    if not ok:
+        raise RuntimeError(out or "could not focus TurboDraft")
+
+
+def keystroke_action(ch: str, modifiers: str = "") -> str:
+    if modifiers:
+        return f'keystroke "{ch}" using {{{modifiers}}}'
+    return f'keystroke "{ch}"'
 
 
-def type_text(text: str, timeout_s: float = 8.0) -> None:
-    safe = text.replace("\\", "\\\\").replace('"', '\\"')
-    script = f'tell application "System Events" to keystroke "{safe}"'
-    cp = run_osascript(script, timeout_s=timeout_s)
-    if cp.returncode != 0:
-        raise RuntimeError(cp.stderr.strip() or cp.stdout.strip() or "failed typing text")
+def type_action(text: str) -> str:
+    return f'keystroke "{apple_escape(text)}"'
+
+
+def delay_action(seconds: float) -> str:
+    return f"delay {seconds:g}"
+
+
+def run_sequence(actions: List[str], timeout_s: float = 8.0) -> None:
+    # One script per burst: System Events queues the keystrokes in order,
+    # so only the paced delays need to survive, not a round trip per key.
+    script = 'tell application "System Events"\n' + "\n".join(f"  {a}" for a in actions) + "\nend tell\n"
+    ok, out = _OSA_SERVER.run(script, timeout_s=timeout_s)
+    if not ok:
+        raise RuntimeError(out or "failed keystroke sequence")
+
+
+def send_key(ch: str, modifiers: str = "", timeout_s: float = 8.0) -> None:
+    run_sequence([keystroke_action(ch, modifiers)], timeout_s=timeout_s)
 
 
 def set_clipboard(text: str) -> None:
+    if AppKit is not None:
+        pb = AppKit.NSPasteboard.generalPasteboard()
+        pb.clearContents()
+        if not pb.setString_forType_(text, AppKit.NSPasteboardTypeString):
+            raise RuntimeError("failed to set clipboard")
+        return
     cp = subprocess.run(["pbcopy"], input=text, text=True, capture_output=True)
     if cp.returncode != 0:
         raise RuntimeError(cp.stderr.strip() or "failed to set clipboard")
 
 
-def copy_editor_text() -> str:
-    send_key("a", modifiers="command down")
-    time.sleep(0.03)
-    send_key("c", modifiers="command down")
-    time.sleep(0.03)
+def read_clipboard() -> str:
+    if AppKit is not None:
+        text = AppKit.NSPasteboard.generalPasteboard().stringForType_(AppKit.NSPasteboardTypeString)
+        return str(text) if text is not None else ""
     cp = subprocess.run(["pbpaste"], text=True, capture_output=True)
     return cp.stdout
 
 
-def assert_editor_text(expected: str, label: str) -> None:
-    actual = copy_editor_text().strip("\n")
-    if actual != expected:
-        raise AssertionError(f"{label}: expected={expected!r} actual={actual!r}")
+def copy_editor_text() -> str:
+    run_sequence([
+        keystroke_action("a", "command down"),
+        delay_action(0.03),
+        keystroke_action("c", "command down"),
+    ])
+    time.sleep(0.03)
+    return read_clipboard()
+
+
+def wait_until(pred: Callable[[], bool], timeout_s: float = 0.3, step_s: float = 0.015) -> bool:
+    deadline = time.monotonic() + timeout_s
+    while True:
+        if pred():
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(step_s)
+
+
+def assert_editor_text(expected: str, label: str, timeout_s: float = 1.0) -> None:
+    # Poll instead of sleeping a worst-case pad before a single probe; the
+    # check passes as soon as the editor has applied the last keystroke.
+    last = ""
+
+    def matches() -> bool:
+        nonlocal last
+        last = copy_editor_text().strip("\n")
+        return last == expected
+
+    if not wait_until(matches, timeout_s=timeout_s):
+        raise AssertionError(f"{label}: expected={expected!r} actual={last!r}")
 
 
 def wait_for_editor_text(expected: str, timeout_s: float = 3.0) -> None:
-    end = time.time() + timeout_s
     last = ""
-    while time.time() < end:
+
+    def matches() -> bool:
+        nonlocal last
         try:
             last = copy_editor_text().strip("\n")
-            if last == expected:
-                return
         except Exception:
-            pass
-        time.sleep(0.06)
-    raise RuntimeError(f"editor did not reach expected initial text {expected!r}; last={last!r}")
+            return False
+        return last == expected
+
+    if not wait_until(matches, timeout_s=timeout_s, step_s=0.06):
+        raise RuntimeError(f"editor did not reach expected initial text {expected!r}; last={last!r}")
 
 
 def main() -> int:
@@ -118,54 +324,53 @@ def main() -> int:
 
     proc = subprocess.Popen([str(turbodraft_bin), str(fixture)], cwd=str(repo))
     try:
-      time.sleep(0.25)
-      set_frontmost(timeout_s=args.timeout_s)
+      # No fixed launch pause: the PID wait gates on the process and
+      # wait_for_editor_text gates on the window having loaded the fixture.
+      set_frontmost(wait_for_app_pid(), timeout_s=args.timeout_s)
       wait_for_editor_text("draft")
 
-      send_key("a", modifiers="command down")
       set_clipboard("improved1")
-      send_key("v", modifiers="command down")
-      time.sleep(0.05)
-      type_text(" + edit1")
-      time.sleep(0.05)
+      run_sequence([
+          keystroke_action("a", "command down"),
+          keystroke_action("v", "command down"),
+          delay_action(0.05),
+          type_action(" + edit1"),
+          delay_action(0.05),
+      ])
 
-      send_key("a", modifiers="command down")
       set_clipboard("improved2")
-      send_key("v", modifiers="command down")
-      time.sleep(0.05)
-      type_text(" + edit2")
-      time.sleep(0.06)
+      run_sequence([
+          keystroke_action("a", "command down"),
+          keystroke_action("v", "command down"),
+          delay_action(0.05),
+          type_action(" + edit2"),
+      ])
       assert_editor_text("improved2 + edit2", "after edits")
 
       send_key("z", modifiers="command down")
-      time.sleep(0.05)
       assert_editor_text("improved2", "undo 1")
       send_key("z", modifiers="command down")
-      time.sleep(0.05)
       assert_editor_text("improved1 + edit1", "undo 2")
       send_key("z", modifiers="command down")
-      time.sleep(0.05)
       assert_editor_text("improved1", "undo 3")
       send_key("z", modifiers="command down")
-      time.sleep(0.05)
       assert_editor_text("draft", "undo 4")
 
       send_key("z", modifiers="command down, shift down")
-      time.sleep(0.05)
       assert_editor_text("improved1", "redo 1")
       send_key("z", modifiers="command down, shift down")
-      time.sleep(0.05)
       assert_editor_text("improved1 + edit1", "redo 2")
       send_key("z", modifiers="command down, shift down")
-      time.sleep(0.05)
       assert_editor_text("improved2", "redo 3")
       send_key("z", modifiers="command down, shift down")
-      time.sleep(0.05)
       assert_editor_text("improved2 + edit2", "redo 4")
 
-      send_key("s", modifiers="command down")
-      time.sleep(0.03)
-      send_key("w", modifiers="command down")
+      # Closing flushes any unsaved edit before the session is marked closed,
+      # so the CLI exiting already implies the fixture is on disk.
+      run_sequence([
+          keystroke_action("s", "command down"),
+          keystroke_action("w", "command down"),
+      ])
 
       try:
           proc.wait(timeout=max(2.0, args.timeout_s))
@@ -178,6 +383,7 @@ def main() -> int:
       print(str(exc), file=sys.stderr)
       return 1
     finally:
+      _OSA_SERVER.close()
       if proc.poll() is None:
           proc.terminate()
           try: